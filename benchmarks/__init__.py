@@ -0,0 +1 @@
+"""Benchmarks for the Drooff fire+ integration."""
@@ -0,0 +1,110 @@
+"""Fixtures of the benchmark suite."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+
+import pytest
+from aiohttp import web
+from homeassistant.const import CONF_HOST
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.drooff_fireplus.const import (
+    CONF_FAST_POLLING_INTERVAL,
+    CONF_POLLING_INTERVAL,
+    CONF_SLOW_POLLING_INTERVAL,
+    CONF_SNAPSHOT_MAX_AGE,
+    DOMAIN,
+    MAX_POLLING_INTERVAL,
+    MAX_SNAPSHOT_MAX_AGE,
+    SCHEDULER_RATE,
+)
+from simulator.device import SimulatedFireplus
+from simulator.server import FaultProfile, create_app
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+
+    from homeassistant.core import HomeAssistant
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from custom_components.drooff_fireplus.data import FireplusConfigEntry
+
+# Number of rounds of the benchmarks that send requests. They are paced at the rate limit of the
+# scheduler, so only the requests are measured.
+ROUNDS = 50
+
+
+@pytest.fixture(name="device")
+def device_fixture() -> SimulatedFireplus:
+    """Return a simulated fire+ with a burning fire."""
+    device = SimulatedFireplus(rng=random.Random(0), ignition_rate=1.0)  # noqa: S311
+    device.step(1)
+    # The values that follow the fire are only updated by the next step.
+    device.step(0)
+    return device
+
+
+@pytest.fixture(name="host")
+async def host_fixture(device: SimulatedFireplus) -> AsyncIterator[str]:
+    """Serve the simulated fire+ without latency and return its host."""
+    # The simulation is frozen, so only the benchmarks change the state of the device.
+    runner = web.AppRunner(create_app(device, FaultProfile(apply_delay=0, speed=0)))
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    yield "127.0.0.1:{}".format(*runner.addresses[0][1:])
+    await runner.cleanup()
+
+
+@pytest.fixture(name="config_entry")
+async def config_entry_fixture(
+    hass: HomeAssistant,
+    host: str,
+    enable_custom_integrations: None,  # noqa: ARG001
+) -> AsyncIterator[FireplusConfigEntry]:
+    """Set up the integration for the simulated fire+."""
+    # The orchestrator does not update the entry while it is benchmarked, and every write is based
+    # on the snapshot of the setup instead of reading the settings once it is too old.
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: host},
+        options={
+            CONF_POLLING_INTERVAL: MAX_POLLING_INTERVAL,
+            CONF_FAST_POLLING_INTERVAL: MAX_POLLING_INTERVAL,
+            CONF_SLOW_POLLING_INTERVAL: MAX_POLLING_INTERVAL,
+            CONF_SNAPSHOT_MAX_AGE: MAX_SNAPSHOT_MAX_AGE,
+        },
+        minor_version=3,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.fixture(name="benchmark_async")
+def benchmark_async_fixture(hass: HomeAssistant, benchmark: BenchmarkFixture) -> Callable[..., Awaitable[None]]:
+    """
+    Return a function that benchmarks a coroutine on the event loop of Home Assistant.
+
+    pytest-benchmark only measures functions, so the rounds run in an executor thread, which waits
+    for the coroutine while the event loop is free to run it.
+    """
+
+    async def run(target: Callable[[], Coroutine], setup: Callable[[], None] | None = None) -> None:
+        def prepare() -> None:
+            time.sleep(1 / SCHEDULER_RATE)
+            if setup is not None:
+                setup()
+
+        def measure() -> None:
+            asyncio.run_coroutine_threadsafe(target(), hass.loop).result()
+
+        await hass.async_add_executor_job(partial(benchmark.pedantic, measure, setup=prepare, rounds=ROUNDS))
+
+    return run
@@ -0,0 +1,91 @@
+"""
+Benchmark of the connections created for polling fire+.
+
+Compares a new connection per poll with the keep-alive session of the integration. fire+ is
+simulated by a local web server serving the recorded responses.
+
+Run from the root of the repository with `python -m benchmarks.connections`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import aiohttp
+from aiohttp import web
+
+from custom_components.drooff_fireplus.api import FireplusApiClient, FireplusConnectionStats, create_session
+from custom_components.drooff_fireplus.const import SCHEDULER_RATE
+from custom_components.drooff_fireplus.resolver import FireplusResolver
+
+from .payloads import CONFIGURATION_RESPONSES, PANEL_RESPONSES
+
+POLLS = 100
+VERSION = "2.4.0"
+
+
+async def _start_server() -> web.AppRunner:
+    async def panel(_: web.Request) -> web.Response:
+        return web.Response(body=PANEL_RESPONSES[VERSION])
+
+    async def configuration(_: web.Request) -> web.Response:
+        return web.Response(body=CONFIGURATION_RESPONSES[VERSION])
+
+    app = web.Application()
+    app.router.add_get("/php/easpanel.php", panel)
+    app.router.add_get("/php/easkonfig.php", configuration)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+async def _poll(host: str, session: aiohttp.ClientSession) -> float:
+    """Return the mean duration of a poll in milliseconds."""
+    client = FireplusApiClient(host=host, session=session)
+    duration = 0.0
+    for _ in range(POLLS):
+        # Polls are paced at the rate limit of the scheduler, so only the requests are measured.
+        await asyncio.sleep(1 / SCHEDULER_RATE)
+        started = time.perf_counter()
+        await client.async_get_data()
+        duration += time.perf_counter() - started
+    return duration / POLLS * 1000
+
+
+async def _main() -> None:
+    runner = await _start_server()
+    host = "127.0.0.1:{}".format(*runner.addresses[0][1:])
+
+    stats = FireplusConnectionStats()
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_connection_create_end(*_: object) -> None:
+        stats.created += 1
+
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(force_close=True), trace_configs=[trace_config]
+    ) as session:
+        latency = await _poll(host, session)
+    print(f"new connection per poll: {stats.created} connections, {latency:.3f} ms per poll")  # noqa: T201
+
+    session_stats: dict[str, FireplusConnectionStats] = {}
+    resolver = FireplusResolver()
+    async with create_session(resolver, stats=session_stats) as session:
+        latency = await _poll(host, session)
+    await resolver.close()
+    print(f"keep-alive session:      {session_stats[host].created} connections, {latency:.3f} ms per poll")  # noqa: T201
+
+    await runner.cleanup()
+
+
+def main() -> None:
+    """Print the number of connections and the mean duration of a poll for both sessions."""
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Sample responses of fire+ for the supported firmware layouts."""
+
+from __future__ import annotations
+
+
+def _encode(values: list[str]) -> str:
+    # fire+ returns the values as a JSON encoded string, preceded by a byte order mark.
+    return '\ufeff"' + "\\n".join(values) + '"'
+
+
+PANEL_RESPONSES = {
+    "1.0.0": _encode(["", "1", "3", "4", "50", "450", "55.5", "12.3", "Gruen", "0", "1", "0", "300", ""]),
+    "2.0.0": _encode(
+        ["", "1", "3", "4", "50", "450", "55.5", "12.3", "Gruen blinkt", "0", "1", "300", "70", "0", "0", "0", "42", ""]
+    ),
+    "2.4.0": _encode(
+        [
+            "",
+            "1",
+            "3",
+            "8",
+            "50",
+            "450",
+            "55.5",
+            "12.3",
+            "Gruen blinkt",
+            "0",
+            "1",
+            "300",
+            "70",
+            "0",
+            "0",
+            "0",
+            "42",
+            "600",
+            "250",
+            "auf",
+            "3",
+            "",
+        ]
+    ),
+}
+
+CONFIGURATION_RESPONSES = {
+    version: _encode([version, "900", "0", "123456789", "1", "0", "600", "4711", ""]) for version in PANEL_RESPONSES
+}
@@ -0,0 +1,56 @@
+"""Benchmarks of parsing the responses of fire+ and of the burn rate lookups."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.drooff_fireplus.api import (
+    FireplusResponse,
+    _get_burn_rate_v1,
+    _get_burn_rate_v2,
+    _get_values_for_burn_rate_v1,
+    _get_values_for_burn_rate_v2,
+)
+
+from .payloads import CONFIGURATION_RESPONSES, PANEL_RESPONSES
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.mark.parametrize("version", PANEL_RESPONSES)
+def test_parse_response(benchmark: BenchmarkFixture, version: str) -> None:
+    """Benchmark parsing the responses of every firmware layout."""
+    panel_response = PANEL_RESPONSES[version].encode()
+    configuration_response = CONFIGURATION_RESPONSES[version].encode()
+
+    response = benchmark(FireplusResponse, panel_response, configuration_response)
+
+    assert response.version == version
+
+
+@pytest.mark.parametrize("version", PANEL_RESPONSES)
+def test_changed_fields(benchmark: BenchmarkFixture, version: str) -> None:
+    """Benchmark comparing two snapshots with different temperatures."""
+    configuration_response = CONFIGURATION_RESPONSES[version].encode()
+    previous = FireplusResponse(PANEL_RESPONSES[version].encode(), configuration_response)
+    current = FireplusResponse(
+        PANEL_RESPONSES[version].replace("\\n450\\n", "\\n451\\n", 1).encode(), configuration_response
+    )
+
+    changed_fields = benchmark(current.changed_fields, previous)
+
+    assert changed_fields == {"temperature"}
+
+
+def test_burn_rate_lookup(benchmark: BenchmarkFixture) -> None:
+    """Benchmark the lookups of the burn rates of both API versions in both directions."""
+
+    def lookup() -> None:
+        for burn_rate in range(1, 8):
+            _get_burn_rate_v1(*_get_values_for_burn_rate_v1(burn_rate))
+            _get_burn_rate_v2(*_get_values_for_burn_rate_v2(burn_rate))
+
+    benchmark(lookup)
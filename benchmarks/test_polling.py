@@ -0,0 +1,28 @@
+"""Benchmarks of updating the coordinator from a simulated fire+."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from custom_components.drooff_fireplus.data import FireplusConfigEntry
+    from simulator.device import SimulatedFireplus
+
+
+@pytest.mark.parametrize("seconds", [0, 5], ids=["unchanged", "changed"])
+async def test_coordinator_refresh(
+    config_entry: FireplusConfigEntry,
+    device: SimulatedFireplus,
+    benchmark_async: Callable[..., Awaitable[None]],
+    seconds: float,
+) -> None:
+    """Benchmark a full refresh of the coordinator with unchanged and with changed values."""
+    coordinator = config_entry.runtime_data.coordinator
+
+    await benchmark_async(coordinator.async_refresh, setup=lambda: device.step(seconds))
+
+    assert coordinator.last_update_success
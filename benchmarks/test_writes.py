@@ -0,0 +1,25 @@
+"""Benchmarks of writing settings to a simulated fire+."""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from custom_components.drooff_fireplus.data import FireplusConfigEntry
+
+
+async def test_update_settings(
+    config_entry: FireplusConfigEntry,
+    benchmark_async: Callable[..., Awaitable[None]],
+) -> None:
+    """Benchmark the round trip of writing a changed setting."""
+    client = config_entry.runtime_data.client
+    brightness = itertools.cycle(range(10, 101, 10))
+
+    async def update_settings() -> None:
+        await client.async_update_settings(brightness=next(brightness))
+
+    await benchmark_async(update_settings)
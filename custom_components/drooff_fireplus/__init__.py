@@ -7,27 +7,42 @@ https://github.com/tehlers/ha-drooff-fireplus
 
 from __future__ import annotations
 
-import socket
 from datetime import timedelta
+from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_HOST, Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import config_validation as cv
 from homeassistant.loader import async_get_loaded_integration
 
 from custom_components.drooff_fireplus.const import (
+    CONF_CONNECT_TIMEOUT,
+    CONF_FAST_POLLING_INTERVAL,
     CONF_FORCE_IPV4,
-    CONF_FORCE_IPV4_DEFAULT,
     CONF_POLLING_INTERVAL,
+    CONF_READ_TIMEOUT,
+    CONF_RECORD_TRACE,
+    CONF_REQUEST_DEADLINE,
+    CONF_SLOW_POLLING_INTERVAL,
+    CONF_SNAPSHOT_MAX_AGE,
+    DEFAULT_FAST_POLLING_INTERVAL,
     DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SLOW_POLLING_INTERVAL,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DOMAIN,
 )
 
-from .api import FireplusApiClient
-from .coordinator import FireplusDataUpdateCoordinator
+from .api import FireplusApiClient, FireplusTimingPolicy
+from .coordinator import FireplusDataUpdateCoordinator, get_store
 from .data import FireplusData
+from .orchestrator import async_get_orchestrator
+from .services import async_setup_services
+from .trace import FireplusTraceRecorder
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import FireplusConfigEntry
 
@@ -38,6 +53,27 @@ PLATFORMS: list[Platform] = [
     Platform.NUMBER,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+OPTIONS = (
+    CONF_POLLING_INTERVAL,
+    CONF_FAST_POLLING_INTERVAL,
+    CONF_SLOW_POLLING_INTERVAL,
+    CONF_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT,
+    CONF_REQUEST_DEADLINE,
+    CONF_SNAPSHOT_MAX_AGE,
+)
+
+
+async def async_setup(
+    hass: HomeAssistant,
+    config: ConfigType,  # noqa: ARG001 Unused function argument: `config`
+) -> bool:
+    """Set up the Drooff fire+ integration."""
+    async_setup_services(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -45,28 +81,47 @@ async def async_setup_entry(
     entry: FireplusConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    update_interval, fast_update_interval, slow_update_interval = _get_update_intervals(entry)
     coordinator = FireplusDataUpdateCoordinator(
         hass=hass,
-        update_interval=timedelta(seconds=entry.data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)),
-        host=entry.data[CONF_HOST],
+        config_entry=entry,
+        update_interval=update_interval,
+        fast_update_interval=fast_update_interval,
+        slow_update_interval=slow_update_interval,
     )
+    # All config entries share the connection pool of the orchestrator.
+    orchestrator = async_get_orchestrator(hass)
+
     entry.runtime_data = FireplusData(
         client=FireplusApiClient(
             host=entry.data[CONF_HOST],
-            session=async_get_clientsession(
-                hass,
-                family=socket.AF_INET if entry.data.get(CONF_FORCE_IPV4, CONF_FORCE_IPV4_DEFAULT) else socket.AF_UNSPEC,
-            ),
+            session=orchestrator.session,
+            timing=_get_timing_policy(entry),
+            snapshot_max_age=entry.options.get(CONF_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE),
         ),
+        connection_stats=orchestrator.get_connection_stats(entry.data[CONF_HOST]),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
     )
+    # The recorder is also stopped if the setup fails, e.g. as fire+ is not ready.
+    entry.async_on_unload(partial(_async_stop_recorder, hass, entry))
+    await _async_update_recorder(hass, entry)
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    # The entities are set up from the most recent snapshot, so setup does not depend on fire+
+    # being reachable. Only the very first setup has to wait for fire+.
+    restored = await coordinator.async_restore()
+    if not restored:
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_apply_options))
+
+    if restored:
+        entry.async_create_background_task(hass, coordinator.async_refresh(), name=f"{DOMAIN}_refresh")
+
+    # The orchestrator schedules all further updates.
+    entry.async_on_unload(orchestrator.async_register(coordinator))
 
     return True
 
@@ -79,9 +134,85 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
-async def async_reload_entry(
+async def async_remove_entry(
     hass: HomeAssistant,
     entry: FireplusConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Remove the stored snapshot of a removed entry."""
+    await get_store(hass, entry.entry_id).async_remove()
+
+
+async def async_migrate_entry(
+    hass: HomeAssistant,
+    entry: FireplusConfigEntry,
+) -> bool:
+    """Migrate config entry to the current version."""
+    if entry.version > 1:
+        return False
+
+    if entry.minor_version < 2:  # noqa: PLR2004
+        # The address family is chosen by the resolver, so forcing IPv4 is no longer necessary.
+        data = {**entry.data}
+        data.pop(CONF_FORCE_IPV4, None)
+        hass.config_entries.async_update_entry(entry, data=data, minor_version=2)
+
+    if entry.minor_version < 3:  # noqa: PLR2004
+        # Polling intervals and timeouts are options, so they can be changed without a reload.
+        data = {**entry.data}
+        options = {key: data.pop(key) for key in OPTIONS if key in data}
+        hass.config_entries.async_update_entry(entry, data=data, options={**options, **entry.options}, minor_version=3)
+
+    return True
+
+
+async def async_apply_options(
+    hass: HomeAssistant,
+    entry: FireplusConfigEntry,
+) -> None:
+    """Apply changed options to the running client and coordinator without reloading the entry."""
+    entry.runtime_data.client.timing = _get_timing_policy(entry)
+    entry.runtime_data.client.snapshot_max_age = entry.options.get(CONF_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE)
+    entry.runtime_data.coordinator.set_update_intervals(*_get_update_intervals(entry))
+    await _async_update_recorder(hass, entry)
+    # The next update is scheduled based on the new polling intervals.
+    async_get_orchestrator(hass).async_reschedule(entry.runtime_data.coordinator)
+
+
+def _get_update_intervals(entry: FireplusConfigEntry) -> tuple[timedelta, timedelta, timedelta]:
+    """Return the regular, fast and slow polling interval configured in the options."""
+    return (
+        timedelta(seconds=entry.options.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)),
+        timedelta(seconds=entry.options.get(CONF_FAST_POLLING_INTERVAL, DEFAULT_FAST_POLLING_INTERVAL)),
+        timedelta(seconds=entry.options.get(CONF_SLOW_POLLING_INTERVAL, DEFAULT_SLOW_POLLING_INTERVAL)),
+    )
+
+
+def _get_timing_policy(entry: FireplusConfigEntry) -> FireplusTimingPolicy:
+    """Return the timeouts configured in the options, derived from the polling interval if not set."""
+    timing = FireplusTimingPolicy.from_polling_interval(
+        entry.options.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)
+    )
+    return FireplusTimingPolicy(
+        connect_timeout=entry.options.get(CONF_CONNECT_TIMEOUT, timing.connect_timeout),
+        read_timeout=entry.options.get(CONF_READ_TIMEOUT, timing.read_timeout),
+        deadline=entry.options.get(CONF_REQUEST_DEADLINE, timing.deadline),
+    )
+
+
+async def _async_update_recorder(hass: HomeAssistant, entry: FireplusConfigEntry) -> None:
+    """Start or stop recording the raw responses of fire+ as configured in the options."""
+    client = entry.runtime_data.client
+    if not entry.options.get(CONF_RECORD_TRACE, False):
+        await _async_stop_recorder(hass, entry)
+    elif client.recorder is None:
+        recorder = FireplusTraceRecorder(Path(hass.config.path(DOMAIN, f"trace_{entry.entry_id}.jsonl")))
+        await hass.async_add_executor_job(recorder.start)
+        client.recorder = recorder
+
+
+async def _async_stop_recorder(hass: HomeAssistant, entry: FireplusConfigEntry) -> None:
+    """Stop recording and write the pending records of the trace."""
+    client = entry.runtime_data.client
+    if client.recorder is not None:
+        recorder, client.recorder = client.recorder, None
+        await hass.async_add_executor_job(recorder.stop)
@@ -2,15 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import socket
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import aiohttp
 import async_timeout
 from awesomeversion import AwesomeVersion
 
-from .const import ETHERNET_LINK
+from .const import (
+    CONFIGURATION_REFRESH_INTERVAL,
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    ETHERNET_LINK,
+    MAX_REQUEST_DEADLINE,
+    MIN_REQUEST_DEADLINE,
+    RESPONSE_ENCODING,
+)
+from .scheduler import FireplusRequestPriority, get_scheduler
+
+if TYPE_CHECKING:
+    from .resolver import FireplusResolver
+    from .trace import FireplusTraceRecorder
 
 VERSION_2_0_0 = AwesomeVersion("2.0.0")
 VERSION_2_4_0 = AwesomeVersion("2.4.0")
@@ -32,31 +53,188 @@ class FireplusApiClientInvalidResponseError(
     """Exception to indicate that the response contained invalid data."""
 
 
+@dataclass(frozen=True)
+class FireplusTimingPolicy:
+    """Timeouts (in seconds) of the requests to fire+."""
+
+    # Timeout for establishing a connection
+    connect_timeout: float
+    # Timeout for reading data from an established connection
+    read_timeout: float
+    # Overall timeout for all requests that are part of a single poll or update of settings
+    deadline: float
+
+    @classmethod
+    def from_polling_interval(cls, polling_interval: float) -> FireplusTimingPolicy:
+        """Derive the timeouts from the polling interval, so a poll is finished before the next one is due."""
+        deadline = min(max(polling_interval, MIN_REQUEST_DEADLINE), MAX_REQUEST_DEADLINE)
+        return cls(connect_timeout=deadline / 3, read_timeout=deadline / 2, deadline=deadline)
+
+
+@dataclass
+class FireplusConnectionStats:
+    """Number of connections to fire+ that have been created or reused."""
+
+    created: int = 0
+    reused: int = 0
+
+
+def create_session(
+    resolver: FireplusResolver, *, stats: dict[str, FireplusConnectionStats] | None = None
+) -> aiohttp.ClientSession:
+    """
+    Create a session that keeps a single connection to fire+ alive between polls.
+
+    The session does not close the given resolver, which has to be closed after the session.
+    """
+    trace_config = aiohttp.TraceConfig()
+
+    if stats is not None:
+        # Connections are counted per host, which is taken from the request they are used for.
+        async def on_request_start(_: Any, context: Any, params: aiohttp.TraceRequestStartParams) -> None:
+            context.host = params.url.raw_authority
+
+        async def on_connection_create_end(_: Any, context: Any, __: Any) -> None:
+            stats.setdefault(context.host, FireplusConnectionStats()).created += 1
+
+        async def on_connection_reuseconn(_: Any, context: Any, __: Any) -> None:
+            stats.setdefault(context.host, FireplusConnectionStats()).reused += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+
+    # The web server of fire+ is tiny, so requests are sent one after the other over the same
+    # connection. TCP_NODELAY is set by aiohttp for every connection.
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit_per_host=1,
+            keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+            # The address is cached by the resolver instead.
+            resolver=resolver,
+            use_dns_cache=False,
+        ),
+        trace_configs=[trace_config],
+    )
+
+
 class FireplusApiClient:
     """Drooff fire+ API Client."""
 
+    deduplicated_requests: int
+    # Maximum age (in seconds) of the most recent snapshot to be used as base for updating settings
+    snapshot_max_age: float
+    # If set, the raw responses of fire+ are recorded.
+    recorder: FireplusTraceRecorder | None
+
     def __init__(
         self,
         host: str,
         session: aiohttp.ClientSession,
+        configuration_refresh_interval: float = CONFIGURATION_REFRESH_INTERVAL,
+        snapshot_max_age: float = DEFAULT_SNAPSHOT_MAX_AGE,
+        timing: FireplusTimingPolicy | None = None,
     ) -> None:
         """Drooff fire+ API Client."""
         self._host = host
         self._session = session
-
-    async def async_get_data(self) -> Any:
+        # The scheduler is shared with all other clients of the same host.
+        self._scheduler = get_scheduler(host)
+        self.timing = timing or FireplusTimingPolicy.from_polling_interval(DEFAULT_POLLING_INTERVAL)
+        self._configuration_refresh_interval = configuration_refresh_interval
+        self.snapshot_max_age = snapshot_max_age
+        self._configuration_response: bytes | None = None
+        self._configuration_expires_at = 0.0
+        self._panel_value_count: int | None = None
+        self._last_panel_response: bytes | None = None
+        self._last_response: FireplusResponse | None = None
+        self._last_response_at = 0.0
+        self._write_lock = asyncio.Lock()
+        self._written_settings: dict[str, Any] = {}
+        self._count: int | None = None
+        self._last_write_at = 0.0
+        self._in_flight: dict[str, tuple[FireplusRequestPriority, asyncio.Task[bytes]]] = {}
+        self.deduplicated_requests = 0
+        self.recorder = None
+
+    @property
+    def responses(self) -> tuple[bytes, bytes] | None:
+        """Return the raw panel and configuration responses of the most recent snapshot."""
+        if self._last_panel_response is None or self._configuration_response is None:
+            return None
+        return self._last_panel_response, self._configuration_response
+
+    def restore(self, panel_response: bytes, configuration_response: bytes) -> FireplusResponse:
+        """Restore a snapshot from previously retrieved responses."""
+        response = FireplusResponse(panel_response, configuration_response)
+
+        # The configuration is refreshed on the next poll and, as the snapshot is considered to be
+        # outdated, settings are read from fire+ before they are written.
+        self._configuration_response = configuration_response
+        self._configuration_expires_at = 0.0
+        self._panel_value_count = panel_response.count(b"\\n")
+        self._last_panel_response = panel_response
+        self._last_response = response
+        self._last_response_at = 0.0
+        return response
+
+    async def async_get_data(self, priority: FireplusRequestPriority = FireplusRequestPriority.POLL) -> Any:
         """Get data from the API."""
-        return FireplusResponse(
-            await self._api_wrapper(
-                method="get",
-                url=f"http://{self._host}/php/easpanel.php",
-            ),
-            await self._api_wrapper(
-                method="get",
-                url=f"http://{self._host}/php/easkonfig.php",
-            ),
+        async with self._deadline():
+            return await self._async_get_data(priority)
+
+    async def _async_get_data(self, priority: FireplusRequestPriority) -> FireplusResponse:
+        panel_response = await self._async_get("php/easpanel.php", priority)
+
+        # The number of values in the panel response depends on the firmware version. If it
+        # changes, the firmware has most likely been updated and the cached configuration is stale.
+        panel_value_count = panel_response.count(b"\\n")
+        configuration_refreshed = await self._async_update_configuration(
+            priority, force_refresh=panel_value_count != self._panel_value_count
         )
 
+        # While in standby, fire+ returns identical panel responses for hours. In this case, the
+        # previous snapshot is returned without parsing, so the coordinator can tell that nothing
+        # has changed.
+        if panel_response == self._last_panel_response:
+            self._last_response_at = time.monotonic()
+            return self._last_response
+
+        try:
+            response = FireplusResponse(panel_response, self._configuration_response)
+        except FireplusApiClientInvalidResponseError:
+            if configuration_refreshed:
+                raise
+            # The panel response might not match the cached configuration anymore, so retry once
+            # with a fresh configuration before giving up.
+            await self._async_update_configuration(priority, force_refresh=True)
+            response = FireplusResponse(panel_response, self._configuration_response)
+
+        self._panel_value_count = panel_value_count
+        self._last_panel_response = panel_response
+        self._last_response = response
+        self._last_response_at = time.monotonic()
+        return response
+
+    async def _async_update_configuration(
+        self, priority: FireplusRequestPriority, *, force_refresh: bool = False
+    ) -> bool:
+        """Refresh the cached configuration if required and return whether it was refreshed."""
+        if (
+            not force_refresh
+            and self._configuration_response is not None
+            and time.monotonic() < self._configuration_expires_at
+        ):
+            return False
+
+        configuration_response = await self._async_get("php/easkonfig.php", priority)
+        if configuration_response != self._configuration_response:
+            self._configuration_response = configuration_response
+            # The previous snapshot is based on the outdated configuration and must not be reused.
+            self._last_panel_response = None
+        self._configuration_expires_at = time.monotonic() + self._configuration_refresh_interval
+        return True
+
     async def async_update_settings(
         self,
         *,
@@ -67,54 +245,131 @@ class FireplusApiClient:
         led: bool | None = None,
     ) -> None:
         """Update settings of Drooff fire+."""
-        current_data = await self.async_get_data()
+        changes = {
+            "brightness": brightness,
+            "volume": volume,
+            "ember_burndown": ember_burndown,
+            "burn_rate": burn_rate,
+            "led": led,
+        }
+
+        # Writes are serialized, so concurrent updates neither send the same counter nor revert
+        # the settings written by each other.
+        async with self._write_lock, self._deadline():
+            # Unchanged settings are taken from the most recent snapshot. Only if it is too old, the
+            # current settings are read from fire+ before writing.
+            if self._last_response is not None and time.monotonic() - self._last_response_at <= self.snapshot_max_age:
+                current_data = self._last_response
+            else:
+                current_data = await self.async_get_data(FireplusRequestPriority.WRITE)
+
+            settings = {
+                "brightness": current_data.brightness,
+                "volume": current_data.volume,
+                "ember_burndown": current_data.ember_burndown,
+                "burn_rate": current_data.burn_rate,
+                "led": current_data.led,
+            }
+            count = current_data.count
+
+            # If the snapshot has been taken before the previous write, or fire+ has not yet applied
+            # the previous write, the settings and counter of the previous write are the base.
+            if self._last_response_at < self._last_write_at or (
+                self._count is not None and current_data.count == (self._count - 1) % 100
+            ):
+                settings.update(self._written_settings)
+                count = self._count
+
+            settings.update({name: value for name, value in changes.items() if value is not None})
+
+            if current_data.version >= VERSION_2_0_0:
+                burn_rate_values = _get_values_for_burn_rate_v2(settings["burn_rate"])
+                count = (count + 1) % 100
+
+                data = {
+                    "Betrieb": burn_rate_values[0],
+                    "Leistung": burn_rate_values[1],
+                    "Helligkeit": settings["brightness"],
+                    "Bedienung": int(current_data.web_controls_shown),
+                    "AB": int(settings["ember_burndown"]),
+                    "Lautstaerke": settings["volume"],
+                    "CNT": count,
+                }
+            else:
+                burn_rate_values = _get_values_for_burn_rate_v1(settings["burn_rate"])
 
-        if current_data.version >= VERSION_2_0_0:
-            burn_rate_values = _get_values_for_burn_rate_v2(
-                burn_rate if burn_rate is not None else current_data.burn_rate
-            )
+                data = {
+                    "Betrieb": burn_rate_values[0],
+                    "Leistung": burn_rate_values[1],
+                    "Helligkeit": settings["brightness"],
+                    "Bedienung": int(current_data.web_controls_shown),
+                    "LED": int(settings["led"]),
+                    "AB": int(settings["ember_burndown"]),
+                }
 
-            data = {
-                "Betrieb": burn_rate_values[0],
-                "Leistung": burn_rate_values[1],
-                "Helligkeit": brightness if brightness is not None else current_data.brightness,
-                "Bedienung": int(current_data.web_controls_shown),
-                "AB": int(ember_burndown if ember_burndown is not None else current_data.ember_burndown),
-                "Lautstaerke": volume if volume is not None else current_data.volume,
-                "CNT": (current_data.count + 1) % 100,
-            }
-        else:
-            burn_rate_values = _get_values_for_burn_rate_v1(
-                burn_rate if burn_rate is not None else current_data.burn_rate
+            await self._api_wrapper(
+                method="post",
+                url=f"http://{self._host}/php/easpanelW.php",
+                data=data,
+                priority=FireplusRequestPriority.WRITE,
             )
 
-            data = {
-                "Betrieb": burn_rate_values[0],
-                "Leistung": burn_rate_values[1],
-                "Helligkeit": brightness if brightness is not None else current_data.brightness,
-                "Bedienung": int(current_data.web_controls_shown),
-                "LED": int(led if led is not None else current_data.led),
-                "AB": int(ember_burndown if ember_burndown is not None else current_data.ember_burndown),
-            }
+            self._written_settings = settings
+            self._count = count
+            self._last_write_at = time.monotonic()
+
+    async def _async_get(self, path: str, priority: FireplusRequestPriority) -> bytes:
+        """Get the given path, sharing the result with concurrent requests of the same path."""
+        in_flight = self._in_flight.get(path)
 
-        await self._api_wrapper(method="post", url=f"http://{self._host}/php/easpanelW.php", data=data)
+        # A request that is still waiting with a lower priority is not joined, as this would delay
+        # the more urgent one.
+        if in_flight is not None and in_flight[0] <= priority:
+            self.deduplicated_requests += 1
+            # If one of the callers gives up, the request continues for the others.
+            return await asyncio.shield(in_flight[1])
+
+        request = asyncio.create_task(
+            self._api_wrapper(method="get", url=f"http://{self._host}/{path}", priority=priority)
+        )
+        self._in_flight[path] = (priority, request)
+
+        def on_done(_: asyncio.Task[bytes]) -> None:
+            if self._in_flight.get(path, (None, None))[1] is request:
+                del self._in_flight[path]
+            # The result might not be retrieved if all callers have given up.
+            if request.cancelled() or request.exception() is not None:
+                return
+            # Each response is recorded once, regardless of the number of callers sharing it.
+            if self.recorder is not None:
+                self.recorder.record(path, request.result())
+
+        request.add_done_callback(on_done)
+        return await asyncio.shield(request)
 
     async def _api_wrapper(
         self,
         method: str,
         url: str,
         data: dict | None = None,
+        priority: FireplusRequestPriority = FireplusRequestPriority.POLL,
     ) -> Any:
         """Get information from the API."""
         try:
-            async with async_timeout.timeout(10):
+            # The time spent waiting for the scheduler counts towards the deadline.
+            async with async_timeout.timeout(self.timing.deadline), self._scheduler.slot(priority):
                 response = await self._session.request(
                     method=method,
                     url=url,
                     data=data,
+                    timeout=aiohttp.ClientTimeout(
+                        sock_connect=self.timing.connect_timeout,
+                        sock_read=self.timing.read_timeout,
+                    ),
                 )
                 response.raise_for_status()
-                return await response.text()
+                # The raw bytes are parsed directly, which avoids detecting the charset and decoding.
+                return await response.read()
 
         except TimeoutError as exception:
             msg = f"Timeout error fetching information - {exception}"
@@ -132,108 +387,301 @@ class FireplusApiClient:
                 msg,
             ) from exception
 
+    @asynccontextmanager
+    async def _deadline(self) -> AsyncIterator[None]:
+        """Limit the overall duration of all requests within the context."""
+        try:
+            async with async_timeout.timeout(self.timing.deadline):
+                yield
+        except TimeoutError as exception:
+            msg = f"Deadline of {self.timing.deadline} s exceeded - {exception}"
+            raise FireplusApiClientCommunicationError(
+                msg,
+            ) from exception
 
-class FireplusResponse:
-    """Stores the metrics and data retrieved from the Drooff fire+ API."""
 
+class FireplusResponse:
+    """
+    Immutable snapshot of the metrics and data retrieved from the Drooff fire+ API.
+
+    Values read from the configuration of fire+ are shared between all snapshots based on the
+    same configuration. Values that are not supported by the firmware of fire+ are `None`.
+    """
+
+    __slots__ = (
+        "_configuration",
+        "air_slider",
+        "brightness",
+        "burn_rate",
+        "chimney_draught",
+        "count",
+        "door_open",
+        "ember_burndown",
+        "error",
+        "error_code",
+        "ethernet_link",
+        "heating_progress",
+        "led",
+        "operation_status",
+        "target_temperature",
+        "temperature",
+        "volume",
+        "web_controls_shown",
+        "weight",
+        "wifi_signal_strength",
+    )
+
+    # Names of the values that are read from the panel response
+    PANEL_FIELDS: ClassVar[tuple[str, ...]] = __slots__[1:]
+
+    # Names of the values that are read from the configuration response
+    CONFIGURATION_FIELDS: ClassVar[tuple[str, ...]] = (
+        "chimney_draught_available",
+        "max_temperature",
+        "operating_time",
+        "serial_number",
+        "version",
+    )
+
+    FIELDS: ClassVar[frozenset[str]] = frozenset(PANEL_FIELDS + CONFIGURATION_FIELDS)
+
+    _configuration: _FireplusConfiguration
     brightness: int
     volume: int | None
     temperature: int
-    max_temperature: int
     air_slider: float
     chimney_draught: float
     operation_status: FireplusOperationStatus
     error: FireplusError
     error_code: int
-    count: int
-    operating_time: int | None
-    chimney_draught_available: bool
+    count: int | None
     ember_burndown: bool
     heating_progress: float
     web_controls_shown: bool
     burn_rate: int
-    serial_number: str
     led: bool | None
-    version: AwesomeVersion
     door_open: bool | None
     weight: float | None
     target_temperature: int | None
     ethernet_link: bool | None
     wifi_signal_strength: int | None
 
-    def __init__(self, panel_response: str, configuration_response: str) -> None:
+    def __init__(self, panel_response: bytes | str, configuration_response: bytes | str) -> None:
         """Metrics and data retrieved from the Drooff fire+ API."""
+        if isinstance(panel_response, str):
+            panel_response = panel_response.encode(RESPONSE_ENCODING)
+        if isinstance(configuration_response, str):
+            configuration_response = configuration_response.encode(RESPONSE_ENCODING)
+
         try:
-            panel_values = panel_response[2:-1].split("\\n")
-            configuration_values = configuration_response[2:-1].split("\\n")
-
-            self.version = AwesomeVersion(configuration_values[0])
-
-            self.web_controls_shown = panel_values[1] == "1"
-            self.brightness = int(panel_values[4])
-            self.temperature = int(panel_values[5])
-            self.air_slider = float(panel_values[6])
-            self.chimney_draught = float(panel_values[7])
-            self.operation_status = _get_operation_status(panel_values[8])
-            self.error = _get_error(int(panel_values[9]))
-            self.error_code = int(panel_values[9])
-
-            self.max_temperature = int(configuration_values[1])
-            # In the source code of the fire+ webapp, the value is called 'hardware version'.
-            # As it looks more like a serial number, we use it as such for the time being, in
-            # particular to make it part of the unique id.
-            self.serial_number = configuration_values[3]
-            self.chimney_draught_available = configuration_values[4] == "1"
-
-            if self.version >= VERSION_2_4_0:
-                self.__init_version2_4(panel_values, configuration_values)
-            elif self.version >= VERSION_2_0_0:
-                self.__init_version2(panel_values, configuration_values)
-            else:
-                self.__init_version1(panel_values, configuration_values)
+            configuration = _parse_configuration(configuration_response)
+            # Attributes are set through their slot descriptors, as `__setattr__` prevents modifications.
+            _set_configuration(self, configuration)
+
+            panel_values = _split_values(panel_response)
+            for set_attribute, extract in configuration.panel_layout:
+                set_attribute(self, extract(panel_values, configuration))
 
         except (IndexError, ValueError) as exception:
-            msg = f"Error parsing responses from fire+: '{panel_response}' and '{configuration_response}'"
+            msg = f"Error parsing responses from fire+: {panel_response!r} and {configuration_response!r}"
             raise FireplusApiClientInvalidResponseError(
                 msg,
             ) from exception
 
-    def __init_version1(self, panel_values: list[str], configuration_values: list[str]) -> None:
-        self.volume = None
-        self.ember_burndown = panel_values[11] == "1"
-        self.count = None
-        self.led = panel_values[10] == "1"
-        self.burn_rate = _get_burn_rate_v1(int(panel_values[2]), int(panel_values[3]))
-        self.operating_time = None
-        self.heating_progress = (int(panel_values[12]) / int(configuration_values[6])) * 100
-        self.door_open = None
-        self.weight = None
-        self.target_temperature = None
-        self.ethernet_link = None
-        self.wifi_signal_strength = None
-
-    def __init_version2(self, panel_values: list[str], configuration_values: list[str]) -> None:
-        self.volume = int(panel_values[12])
-        self.ember_burndown = panel_values[10] == "1"
-        self.count = int(panel_values[16])
-        self.led = None
-        self.burn_rate = _get_burn_rate_v2(int(panel_values[2]), int(panel_values[3]))
-        self.operating_time = int(configuration_values[7])
-        self.heating_progress = (int(panel_values[11]) / int(configuration_values[6])) * 100
-        self.door_open = None
-        self.weight = None
-        self.target_temperature = None
-        self.ethernet_link = None
-        self.wifi_signal_strength = None
-
-    def __init_version2_4(self, panel_values: list[str], configuration_values: list[str]) -> None:
-        self.__init_version2(panel_values, configuration_values)
-        self.door_open = (panel_values[19]) == "auf"
-        self.weight = float(panel_values[18]) / 100
-        self.target_temperature = int(panel_values[17])
-        network = int(panel_values[20])
-        self.ethernet_link = network == ETHERNET_LINK
-        self.wifi_signal_strength = network if network > 0 and network < ETHERNET_LINK else None
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent modifications of the snapshot."""
+        msg = f"'{type(self).__name__}' is immutable"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        """Prevent modifications of the snapshot."""
+        msg = f"'{type(self).__name__}' is immutable"
+        raise AttributeError(msg)
+
+    @property
+    def version(self) -> AwesomeVersion:
+        """Return the firmware version of fire+."""
+        return self._configuration.version
+
+    @property
+    def max_temperature(self) -> int:
+        """Return the maximum temperature of the combustion chamber."""
+        return self._configuration.max_temperature
+
+    @property
+    def serial_number(self) -> str:
+        """Return the serial number of fire+."""
+        return self._configuration.serial_number
+
+    @property
+    def chimney_draught_available(self) -> bool:
+        """Return true if fire+ is able to measure the chimney draught."""
+        return self._configuration.chimney_draught_available
+
+    @property
+    def operating_time(self) -> int | None:
+        """Return the total operating time in seconds."""
+        return self._configuration.operating_time
+
+    @property
+    def max_burn_rate(self) -> int:
+        """Return the highest burn rate supported by the firmware of fire+."""
+        return len(_BURN_RATE_LOOKUP_V2 if self.version >= VERSION_2_0_0 else _BURN_RATE_LOOKUP_V1)
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        """Return the names of the values that are provided by the firmware of fire+."""
+        return self._configuration.capabilities
+
+    def changed_fields(self, previous: FireplusResponse | None) -> frozenset[str]:
+        """Return the names of the values that differ from the previous snapshot."""
+        if previous is None:
+            return FireplusResponse.FIELDS
+        if previous is self:
+            return frozenset()
+
+        return frozenset(name for name in FireplusResponse.FIELDS if getattr(self, name) != getattr(previous, name))
+
+
+_set_configuration = FireplusResponse._configuration.__set__  # noqa: SLF001
+
+
+class _FireplusConfiguration:
+    """Values of the fire+ configuration and the panel layout matching its firmware version."""
+
+    __slots__ = (
+        "capabilities",
+        "chimney_draught_available",
+        "heating_reference",
+        "max_temperature",
+        "operating_time",
+        "panel_layout",
+        "serial_number",
+        "version",
+    )
+
+    def __init__(self, configuration_response: bytes) -> None:
+        """Parse the configuration response of fire+."""
+        configuration_values = _split_values(configuration_response)
+        version = configuration_values[0].decode(RESPONSE_ENCODING)
+
+        self.version = AwesomeVersion(version)
+        self.max_temperature = int(configuration_values[1])
+        # In the source code of the fire+ webapp, the value is called 'hardware version'.
+        # As it looks more like a serial number, we use it as such for the time being, in
+        # particular to make it part of the unique id.
+        self.serial_number = configuration_values[3].decode(RESPONSE_ENCODING)
+        self.chimney_draught_available = configuration_values[4] == b"1"
+        self.heating_reference = int(configuration_values[6])
+        self.operating_time = int(configuration_values[7]) if self.version >= VERSION_2_0_0 else None
+        self.panel_layout = _get_panel_layout(version)
+        self.capabilities = _get_capabilities(version)
+
+
+@lru_cache(maxsize=4)
+def _parse_configuration(configuration_response: bytes) -> _FireplusConfiguration:
+    # The client keeps the configuration response between polls, so it is only parsed once.
+    return _FireplusConfiguration(configuration_response)
+
+
+def _split_values(response: bytes) -> list[bytes]:
+    # fire+ responds with a JSON encoded string of values separated by '\\n'. The first two
+    # characters and the last character are not part of the values. If the response starts
+    # with a UTF-8 byte order mark, the first character takes three bytes.
+    start = 4 if response.startswith(codecs.BOM_UTF8) else 2
+    return response[start:-1].split(b"\\n")
+
+
+# A panel layout maps the setter of every attribute of `FireplusResponse` that is read from the
+# panel response to a function extracting its value from the panel values and the configuration.
+type _PanelLayout = tuple[
+    tuple[Callable[[FireplusResponse, Any], None], Callable[[list[bytes], _FireplusConfiguration], Any]], ...
+]
+
+
+@cache
+def _get_panel_layout(version: str) -> _PanelLayout:
+    """Compile the panel layout for a firmware version, so it is determined only once per version."""
+    return tuple(
+        (getattr(FireplusResponse, attribute).__set__, extract) for attribute, extract in _get_panel_extractors(version)
+    )
+
+
+@cache
+def _get_capabilities(version: str) -> frozenset[str]:
+    """Return the names of the values that are provided by a firmware version."""
+    unsupported = {attribute for attribute, extract in _get_panel_extractors(version) if extract is _unsupported}
+    if AwesomeVersion(version) < VERSION_2_0_0:
+        unsupported.add("operating_time")
+    return FireplusResponse.FIELDS - unsupported
+
+
+def _unsupported(_: list[bytes], __: _FireplusConfiguration) -> None:
+    """Extract a value that is not provided by the firmware version."""
+    return
+
+
+def _get_panel_extractors(
+    version: str,
+) -> list[tuple[str, Callable[[list[bytes], _FireplusConfiguration], Any]]]:
+    """Return the functions extracting every value from the panel response of a firmware version."""
+    layout = [
+        ("web_controls_shown", lambda values, _: values[1] == b"1"),
+        ("brightness", lambda values, _: int(values[4])),
+        ("temperature", lambda values, _: int(values[5])),
+        ("air_slider", lambda values, _: float(values[6])),
+        ("chimney_draught", lambda values, _: float(values[7])),
+        ("operation_status", lambda values, _: _get_operation_status(values[8])),
+        ("error", lambda values, _: _get_error(int(values[9]))),
+        ("error_code", lambda values, _: int(values[9])),
+    ]
+
+    firmware_version = AwesomeVersion(version)
+
+    if firmware_version >= VERSION_2_0_0:
+        layout += [
+            ("volume", lambda values, _: int(values[12])),
+            ("ember_burndown", lambda values, _: values[10] == b"1"),
+            ("count", lambda values, _: int(values[16])),
+            ("led", _unsupported),
+            ("burn_rate", lambda values, _: _get_burn_rate_v2(int(values[2]), int(values[3]))),
+            (
+                "heating_progress",
+                lambda values, configuration: (int(values[11]) / configuration.heating_reference) * 100,
+            ),
+        ]
+    else:
+        layout += [
+            ("volume", _unsupported),
+            ("ember_burndown", lambda values, _: values[11] == b"1"),
+            ("count", _unsupported),
+            ("led", lambda values, _: values[10] == b"1"),
+            ("burn_rate", lambda values, _: _get_burn_rate_v1(int(values[2]), int(values[3]))),
+            (
+                "heating_progress",
+                lambda values, configuration: (int(values[12]) / configuration.heating_reference) * 100,
+            ),
+        ]
+
+    if firmware_version >= VERSION_2_4_0:
+        layout += [
+            ("door_open", lambda values, _: values[19] == b"auf"),
+            ("weight", lambda values, _: float(values[18]) / 100),
+            ("target_temperature", lambda values, _: int(values[17])),
+            ("ethernet_link", lambda values, _: int(values[20]) == ETHERNET_LINK),
+            ("wifi_signal_strength", lambda values, _: _get_wifi_signal_strength(int(values[20]))),
+        ]
+    else:
+        layout += [
+            (attribute, _unsupported)
+            for attribute in ("door_open", "weight", "target_temperature", "ethernet_link", "wifi_signal_strength")
+        ]
+
+    return layout
+
+
+def _get_wifi_signal_strength(network: int) -> int | None:
+    return network if network > 0 and network < ETHERNET_LINK else None
 
 
 class FireplusOperationStatus(Enum):
@@ -252,18 +700,18 @@ class FireplusOperationStatus(Enum):
 
 # Lookup table of LED status to operation status
 _OPERATION_STATUS_LOOKUP = {
-    "aus": FireplusOperationStatus.STANDBY,
-    "Gruen": FireplusOperationStatus.REGULAR,
-    "Gruen blinkt": FireplusOperationStatus.HEATING,
-    "Gelb": FireplusOperationStatus.WOOD_REQUIRED,
-    "Gelb blinkt": FireplusOperationStatus.WOOD_URGENTLY_REQUIRED,
-    "Violett dunkel": FireplusOperationStatus.EMBER_PRESERVATION,
-    "Orange": FireplusOperationStatus.EMBER_BURNDOWN,
-    "Rot blinkt": FireplusOperationStatus.ERROR,
+    b"aus": FireplusOperationStatus.STANDBY,
+    b"Gruen": FireplusOperationStatus.REGULAR,
+    b"Gruen blinkt": FireplusOperationStatus.HEATING,
+    b"Gelb": FireplusOperationStatus.WOOD_REQUIRED,
+    b"Gelb blinkt": FireplusOperationStatus.WOOD_URGENTLY_REQUIRED,
+    b"Violett dunkel": FireplusOperationStatus.EMBER_PRESERVATION,
+    b"Orange": FireplusOperationStatus.EMBER_BURNDOWN,
+    b"Rot blinkt": FireplusOperationStatus.ERROR,
 }
 
 
-def _get_operation_status(led_status: str) -> FireplusOperationStatus:
+def _get_operation_status(led_status: bytes) -> FireplusOperationStatus:
     return _OPERATION_STATUS_LOOKUP.get(led_status, FireplusOperationStatus.UNKNOWN)
 
 
@@ -12,7 +12,7 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.const import EntityCategory
 
 from .api import FireplusError
-from .entity import FireplusEntity
+from .entity import FireplusEntity, async_add_supported_entities
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -23,23 +23,28 @@ if TYPE_CHECKING:
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: FireplusConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
-    async_add_entities(
-        [
-            FireplusErrorSensor(entry.runtime_data.coordinator),
-            FireplusDoorSensor(entry.runtime_data.coordinator),
-            FireplusEthernetLinkSensor(entry.runtime_data.coordinator),
-        ]
+    async_add_supported_entities(
+        hass,
+        entry,
+        async_add_entities,
+        (
+            FireplusErrorSensor,
+            FireplusDoorSensor,
+            FireplusEthernetLinkSensor,
+        ),
     )
 
 
 class FireplusErrorSensor(FireplusEntity, BinarySensorEntity):
     """Drooff fire+ error sensor."""
 
+    _fireplus_fields = ("error", "error_code")
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -73,6 +78,8 @@ class FireplusErrorSensor(FireplusEntity, BinarySensorEntity):
 class FireplusDoorSensor(FireplusEntity, BinarySensorEntity):
     """Drooff fire+ door sensor."""
 
+    _fireplus_fields = ("door_open",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -88,25 +95,17 @@ class FireplusDoorSensor(FireplusEntity, BinarySensorEntity):
         )
         self.device_class = BinarySensorDeviceClass.DOOR
 
-    @property
-    def available(self) -> bool | None:
-        """Return the availability of the sensor."""
-        return self.coordinator.data.door_open is not None
-
     @property
     def is_on(self) -> bool:
         """Return true if the fire+ door is open."""
         return self.coordinator.data.door_open
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added."""
-        return self.available
-
 
 class FireplusEthernetLinkSensor(FireplusEntity, BinarySensorEntity):
     """Drooff fire+ ethernet link sensor."""
 
+    _fireplus_fields = ("ethernet_link",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -123,21 +122,11 @@ class FireplusEthernetLinkSensor(FireplusEntity, BinarySensorEntity):
         )
         self.device_class = BinarySensorDeviceClass.CONNECTIVITY
 
-    @property
-    def available(self) -> bool | None:
-        """Return the availability of the sensor."""
-        return self.coordinator.data.ethernet_link is not None
-
     @property
     def is_on(self) -> bool:
         """Return true if the fire+ is connected to the network via ethernet."""
         return self.coordinator.data.ethernet_link
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added."""
-        return self.available
-
     @property
     def icon(self) -> str:
         """Return icon that represents the status of the ethernet link."""
@@ -2,42 +2,64 @@
 
 from __future__ import annotations
 
-import socket
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, UnitOfTime
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .api import (
     FireplusApiClient,
     FireplusApiClientCommunicationError,
     FireplusApiClientError,
+    create_session,
 )
 from .const import (
-    CONF_FORCE_IPV4,
-    CONF_FORCE_IPV4_DEFAULT,
+    CONF_CONNECT_TIMEOUT,
+    CONF_FAST_POLLING_INTERVAL,
     CONF_POLLING_INTERVAL,
+    CONF_READ_TIMEOUT,
+    CONF_RECORD_TRACE,
+    CONF_REQUEST_DEADLINE,
+    CONF_SLOW_POLLING_INTERVAL,
+    CONF_SNAPSHOT_MAX_AGE,
+    DEFAULT_FAST_POLLING_INTERVAL,
     DEFAULT_HOST,
     DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SLOW_POLLING_INTERVAL,
+    DEFAULT_SNAPSHOT_MAX_AGE,
     DOMAIN,
     LOGGER,
     MAX_POLLING_INTERVAL,
+    MAX_SLOW_POLLING_INTERVAL,
+    MAX_SNAPSHOT_MAX_AGE,
+    MAX_TIMEOUT,
     MIN_POLLING_INTERVAL,
 )
+from .resolver import FireplusResolver
+from .scheduler import FireplusRequestPriority
+
+if TYPE_CHECKING:
+    from .data import FireplusConfigEntry
+
+TIMEOUTS = (CONF_CONNECT_TIMEOUT, CONF_READ_TIMEOUT, CONF_REQUEST_DEADLINE)
 
 
 class FireplusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Drooff fire+."""
 
     VERSION = 1
-    MINOR_VERSION = 1
+    MINOR_VERSION = 3
 
-    def _show_form(
-        self, *, host: str, force_ipv4: bool, polling_interval: int, errors: dict[str, str]
-    ) -> config_entries.ConfigFlowResult:
+    @staticmethod
+    def async_get_options_flow(
+        config_entry: FireplusConfigEntry,  # noqa: ARG004 Unused static method argument: `config_entry`
+    ) -> FireplusOptionsFlowHandler:
+        """Return the options flow for polling intervals and timeouts."""
+        return FireplusOptionsFlowHandler()
+
+    def _show_form(self, *, host: str, errors: dict[str, str]) -> config_entries.ConfigFlowResult:
         return self.async_show_form(
             step_id=config_entries.SOURCE_USER,
             data_schema=vol.Schema(
@@ -50,30 +72,21 @@ class FireplusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                             type=selector.TextSelectorType.TEXT,
                         ),
                     ),
-                    vol.Required(CONF_FORCE_IPV4, default=force_ipv4): selector.BooleanSelector(),
-                    vol.Required(CONF_POLLING_INTERVAL, default=polling_interval): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=MIN_POLLING_INTERVAL,
-                            max=MAX_POLLING_INTERVAL,
-                            unit_of_measurement=UnitOfTime.SECONDS,
-                        )
-                    ),
                 },
             ),
             errors=errors,
         )
 
-    async def _get_serial_number(self, *, host: str, force_ipv4: bool) -> tuple[str | None, dict[str, str]]:
+    async def _get_serial_number(self, *, host: str) -> tuple[str | None, dict[str, str]]:
         """Connect to the fire+ endpoint and return serial number."""
         errors = {}
-
-        client = FireplusApiClient(
-            host=host,
-            session=async_create_clientsession(self.hass, family=socket.AF_INET if force_ipv4 else socket.AF_UNSPEC),
-        )
+        resolver = FireplusResolver()
 
         try:
-            response = await client.async_get_data()
+            async with create_session(resolver) as session:
+                response = await FireplusApiClient(host=host, session=session).async_get_data(
+                    FireplusRequestPriority.DIAGNOSTIC
+                )
         except FireplusApiClientCommunicationError as exception:
             LOGGER.error(exception)
             errors["base"] = "connection"
@@ -82,6 +95,8 @@ class FireplusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors["base"] = "unknown"
         else:
             return response.serial_number, errors
+        finally:
+            await resolver.close()
 
         return None, errors
 
@@ -95,33 +110,20 @@ class FireplusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             host = user_input.get(CONF_HOST, "")
-            force_ipv4 = user_input.get(CONF_FORCE_IPV4, CONF_FORCE_IPV4_DEFAULT)
-            polling_interval = user_input.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)
-            serial_number, errors = await self._get_serial_number(host=host, force_ipv4=force_ipv4)
+            serial_number, errors = await self._get_serial_number(host=host)
         elif self.source == config_entries.SOURCE_RECONFIGURE:
             existing_config_data = self._get_reconfigure_entry().data
             host = existing_config_data.get(CONF_HOST, DEFAULT_HOST)
-            force_ipv4 = existing_config_data.get(CONF_FORCE_IPV4, CONF_FORCE_IPV4_DEFAULT)
-            polling_interval = existing_config_data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)
         else:
             host = DEFAULT_HOST
-            polling_interval = DEFAULT_POLLING_INTERVAL
-            force_ipv4 = CONF_FORCE_IPV4_DEFAULT
 
         # If the serial number is not set, the form must be displayed to either capture
         # the data or to display an error message.
         if not serial_number:
-            return self._show_form(
-                host=host,
-                force_ipv4=force_ipv4,
-                polling_interval=polling_interval,
-                errors=errors,
-            )
+            return self._show_form(host=host, errors=errors)
 
         config_data = {
             CONF_HOST: host,
-            CONF_FORCE_IPV4: force_ipv4,
-            CONF_POLLING_INTERVAL: polling_interval,
         }
 
         # In the source code of the fire+ webapp, the value we use for `serial_number` is
@@ -131,9 +133,11 @@ class FireplusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         if self.source == config_entries.SOURCE_RECONFIGURE:
             self._abort_if_unique_id_mismatch()
+            # Changing the host requires a new client, so the entry is only reloaded if it has changed.
             return self.async_update_reload_and_abort(
                 self._get_reconfigure_entry(),
                 data_updates=config_data,
+                reload_even_if_entry_is_unchanged=False,
             )
 
         self._abort_if_unique_id_configured()
@@ -148,3 +152,85 @@ class FireplusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> config_entries.ConfigFlowResult:
         """Handle a flow initialized by the user."""
         return await self.async_step_user(user_input)
+
+
+class FireplusOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for the polling intervals, timeouts and recording of Drooff fire+."""
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options, which are applied without reloading the entry."""
+        if user_input is not None:
+            # The options are replaced, so timeouts that have been cleared are derived again.
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_POLLING_INTERVAL,
+                        default=options.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=MIN_POLLING_INTERVAL,
+                            max=MAX_POLLING_INTERVAL,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_FAST_POLLING_INTERVAL,
+                        default=options.get(CONF_FAST_POLLING_INTERVAL, DEFAULT_FAST_POLLING_INTERVAL),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=MIN_POLLING_INTERVAL,
+                            max=MAX_POLLING_INTERVAL,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_SLOW_POLLING_INTERVAL,
+                        default=options.get(CONF_SLOW_POLLING_INTERVAL, DEFAULT_SLOW_POLLING_INTERVAL),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=MIN_POLLING_INTERVAL,
+                            max=MAX_SLOW_POLLING_INTERVAL,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    # Timeouts are optional, as they are derived from the polling interval if not set.
+                    **{
+                        vol.Optional(timeout, description={"suggested_value": options.get(timeout)}): (
+                            selector.NumberSelector(
+                                selector.NumberSelectorConfig(
+                                    min=0.1,
+                                    max=MAX_TIMEOUT,
+                                    step=0.1,
+                                    mode=selector.NumberSelectorMode.BOX,
+                                    unit_of_measurement=UnitOfTime.SECONDS,
+                                )
+                            )
+                        )
+                        for timeout in TIMEOUTS
+                    },
+                    vol.Required(
+                        CONF_SNAPSHOT_MAX_AGE,
+                        default=options.get(CONF_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=MAX_SNAPSHOT_MAX_AGE,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_RECORD_TRACE,
+                        default=options.get(CONF_RECORD_TRACE, False),
+                    ): selector.BooleanSelector(),
+                },
+            ),
+        )
@@ -10,10 +10,9 @@ DEFAULT_HOST = "fire"
 
 UPDATE_FAILED_MSG = "Unable to retrieve updated data from Drooff fire+ API"
 
+# Removed in minor version 2 of the config entry, as the address family is chosen by the resolver.
 CONF_FORCE_IPV4 = "force_ipv4"
 
-CONF_FORCE_IPV4_DEFAULT = True
-
 CONF_POLLING_INTERVAL = "polling_interval"
 
 DEFAULT_POLLING_INTERVAL = 5
@@ -22,4 +21,106 @@ MIN_POLLING_INTERVAL = 1
 
 MAX_POLLING_INTERVAL = 60
 
+# Polling interval (in seconds) while fire+ is heating up, the door is open, the temperature
+# changes quickly or settings have been written recently
+CONF_FAST_POLLING_INTERVAL = "fast_polling_interval"
+
+DEFAULT_FAST_POLLING_INTERVAL = 2
+
+# Polling interval (in seconds) while fire+ is in standby and reports unchanged values
+CONF_SLOW_POLLING_INTERVAL = "slow_polling_interval"
+
+DEFAULT_SLOW_POLLING_INTERVAL = 30
+
+MAX_SLOW_POLLING_INTERVAL = 300
+
+# Duration (in seconds) of fast polling after settings have been written
+FAST_POLLING_AFTER_WRITE = 60
+
+# Change of the temperature (in K/s) from which on fire+ is polled at the fast interval
+FAST_POLLING_TEMPERATURE_RATE = 0.5
+
+# The configuration of fire+ (firmware version, serial number, ...) hardly ever changes, so it is
+# only refreshed at this interval (in seconds) instead of on every poll.
+CONFIGURATION_REFRESH_INTERVAL = 600
+
+# Idle connections to fire+ are kept open for this number of seconds, which spans the regular
+# and the default slow polling interval.
+CONNECTION_KEEPALIVE_TIMEOUT = 60
+
+# Version of the stored snapshot and delay (in seconds) before a changed snapshot is saved.
+STORAGE_VERSION = 1
+
+STORAGE_SAVE_DELAY = 60
+
+# Encoding of the raw responses in the store. Every byte maps to a character and back, so responses
+# that are not valid in the encoding of fire+ can be stored, while the store only holds valid JSON.
+STORAGE_ENCODING = "latin-1"
+
+# Maximum number of config entries that are updated at the same time.
+ORCHESTRATOR_MAX_CONCURRENT_UPDATES = 4
+
+# Rate (in requests per second) and burst size of the requests sent to fire+.
+SCHEDULER_RATE = 5
+
+SCHEDULER_BURST = 3
+
+# Number of seconds the resolved address of fire+ is cached before it is refreshed in the background.
+RESOLVER_CACHE_TTL = 300
+
+# Maximum number of seconds to wait for a connection when racing IPv4 against IPv6.
+RESOLVER_RACE_TIMEOUT = 2
+
+# Maximum age (in seconds) of the most recent snapshot to be used as base for updating settings.
+# If the snapshot is older, the current settings are read from fire+ first.
+CONF_SNAPSHOT_MAX_AGE = "snapshot_max_age"
+
+DEFAULT_SNAPSHOT_MAX_AGE = 10
+
+MAX_SNAPSHOT_MAX_AGE = 300
+
+# Time (in seconds) to collect changes of settings before writing them to fire+ at once
+SETTINGS_WRITE_DELAY = 0.5
+
+# After writing settings, fire+ is polled with increasing intervals (in seconds) until it reports
+# the written values or the timeout (in seconds) expires.
+SETTINGS_CONFIRMATION_INITIAL_INTERVAL = 0.2
+
+SETTINGS_CONFIRMATION_MAX_INTERVAL = 1.0
+
+SETTINGS_CONFIRMATION_TIMEOUT = 5
+
+# Timeouts (in seconds) of the requests to fire+. If not configured, they are derived from the
+# polling interval.
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+
+CONF_READ_TIMEOUT = "read_timeout"
+
+CONF_REQUEST_DEADLINE = "request_deadline"
+
+MIN_REQUEST_DEADLINE = 1
+
+MAX_REQUEST_DEADLINE = 10
+
+MAX_TIMEOUT = 30
+
+# If enabled, the raw responses of fire+ are recorded to a rotating file in the configuration
+# directory, which is rotated once it exceeds the maximum size (in bytes).
+CONF_RECORD_TRACE = "record_trace"
+
+TRACE_MAX_BYTES = 10 * 1024 * 1024
+
+TRACE_BACKUP_COUNT = 5
+
+# Number of consecutive failed updates after which fire+ is considered unreachable
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+
+# Backoff (in seconds) after the first failed update. It doubles with every further failure.
+CIRCUIT_BREAKER_INITIAL_BACKOFF = 1
+
+CIRCUIT_BREAKER_MAX_BACKOFF = 300
+
 ETHERNET_LINK = 5
+
+# Encoding of the responses of the fire+ web application
+RESPONSE_ENCODING = "utf-8"
@@ -3,51 +3,314 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import time
+from datetime import timedelta
+from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import FireplusApiClientError
-from .const import DOMAIN, LOGGER, UPDATE_FAILED_MSG
+from .api import FireplusApiClientError, FireplusOperationStatus, FireplusResponse
+from .const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_INITIAL_BACKOFF,
+    CIRCUIT_BREAKER_MAX_BACKOFF,
+    DOMAIN,
+    FAST_POLLING_AFTER_WRITE,
+    FAST_POLLING_TEMPERATURE_RATE,
+    LOGGER,
+    SETTINGS_CONFIRMATION_INITIAL_INTERVAL,
+    SETTINGS_CONFIRMATION_MAX_INTERVAL,
+    SETTINGS_CONFIRMATION_TIMEOUT,
+    SETTINGS_WRITE_DELAY,
+    STORAGE_ENCODING,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    UPDATE_FAILED_MSG,
+)
+from .scheduler import FireplusRequestPriority
 
 if TYPE_CHECKING:
-    from datetime import timedelta
-
     from homeassistant.core import HomeAssistant
 
     from .data import FireplusConfigEntry
 
 
+def get_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, str]]:
+    """Return the store of the most recent snapshot of the given config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+class FireplusCircuitState(Enum):
+    """State of the circuit breaker protecting fire+."""
+
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+class FireplusCircuitBreaker:
+    """Circuit breaker that limits requests to an unreachable fire+ to one probe per backoff period."""
+
+    state: FireplusCircuitState
+    failures: int
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        initial_backoff: float = CIRCUIT_BREAKER_INITIAL_BACKOFF,
+        max_backoff: float = CIRCUIT_BREAKER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self._failure_threshold = failure_threshold
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._retry_at = 0.0
+        self.state = FireplusCircuitState.CLOSED
+        self.failures = 0
+
+    @property
+    def retry_in(self) -> float:
+        """Return the number of seconds until the next request should be made."""
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    def allow_request(self) -> bool:
+        """Return true if a request may be sent to fire+."""
+        if self.state == FireplusCircuitState.CLOSED:
+            return True
+        # Once the backoff period has passed, a single request probes whether fire+ is reachable again.
+        if self.state == FireplusCircuitState.OPEN and self.retry_in == 0.0:
+            self.state = FireplusCircuitState.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = FireplusCircuitState.CLOSED
+        self.failures = 0
+        self._retry_at = 0.0
+
+    def record_failure(self) -> None:
+        """Extend the backoff after a failed request and open the circuit if the threshold is reached."""
+        self.failures += 1
+        backoff = min(self._initial_backoff * 2 ** (self.failures - 1), self._max_backoff)
+        # The jitter prevents retries of several instances from happening at the same time.
+        self._retry_at = time.monotonic() + backoff * random.uniform(0.5, 1.0)  # noqa: S311
+        if self.failures >= self._failure_threshold:
+            self.state = FireplusCircuitState.OPEN
+
+
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
 class FireplusDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the Drooff fire+ API."""
 
     config_entry: FireplusConfigEntry
     host: str
+    skipped_updates: int
+    changed_fields: frozenset[str]
+    last_confirmation_latency: float | None
+    circuit_breaker: FireplusCircuitBreaker
+    desired_update_interval: timedelta
 
-    def __init__(self, hass: HomeAssistant, update_interval: timedelta, host: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: FireplusConfigEntry,
+        update_interval: timedelta,
+        fast_update_interval: timedelta | None = None,
+        slow_update_interval: timedelta | None = None,
+    ) -> None:
         """Initialize the FireplusDataUpdateCoordinator."""
-        self.host = host
+        self.host = config_entry.data[CONF_HOST]
+        self._fast_polling_until = 0.0
+        self._last_data_at = 0.0
+        self.skipped_updates = 0
+        self.changed_fields = FireplusResponse.FIELDS
+        self.last_confirmation_latency = None
+        self._pending_settings: dict[str, Any] = {}
+        self._settings_write: asyncio.Task | None = None
+        self.circuit_breaker = FireplusCircuitBreaker()
         super().__init__(
             hass,
             logger=LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
-            update_interval=update_interval,
+            # Updates are scheduled by the orchestrator based on `desired_update_interval`.
+            update_interval=None,
+            # The client returns the previous snapshot if fire+ reports unchanged values. As the
+            # snapshots are then equal, listeners are not notified.
+            always_update=False,
         )
+        self._store = get_store(hass, config_entry.entry_id)
+        self.set_update_intervals(update_interval, fast_update_interval, slow_update_interval)
+
+    def set_update_intervals(
+        self,
+        update_interval: timedelta,
+        fast_update_interval: timedelta | None = None,
+        slow_update_interval: timedelta | None = None,
+    ) -> None:
+        """Set the regular, fast and slow polling interval."""
+        self._regular_update_interval = update_interval
+        self._fast_update_interval = min(fast_update_interval or update_interval, update_interval)
+        self._slow_update_interval = max(slow_update_interval or update_interval, update_interval)
+        self.desired_update_interval = update_interval
 
     async def _async_update_data(self) -> Any:
         """Retrieve updated data from Drooff fire+ API."""
-        retries = 0
-        max_retries = 3
+        # If the update fails, the availability of all entities changes.
+        self.changed_fields = FireplusResponse.FIELDS
+
+        # While the circuit is open, updates fail immediately without sending a request to fire+.
+        if not self.circuit_breaker.allow_request():
+            # A probe might still be in progress, in which case there is no backoff period left.
+            self.desired_update_interval = timedelta(
+                seconds=max(self.circuit_breaker.retry_in, CIRCUIT_BREAKER_INITIAL_BACKOFF)
+            )
+            raise UpdateFailed(UPDATE_FAILED_MSG)
+
+        try:
+            data = await self.config_entry.runtime_data.client.async_get_data()
+        except FireplusApiClientError as exception:
+            self.circuit_breaker.record_failure()
+            # The next update is scheduled after the backoff period instead of waiting in between.
+            self.desired_update_interval = timedelta(seconds=self.circuit_breaker.retry_in)
+            if self.data is not None and self.circuit_breaker.state == FireplusCircuitState.CLOSED:
+                # Single failures are tolerated, so the entities keep their state until the retry.
+                LOGGER.debug("Retrying in %.1f s: %s", self.circuit_breaker.retry_in, exception)
+                self.changed_fields = frozenset()
+                return self.data
+            raise UpdateFailed(exception) from exception
+        except Exception:
+            # Any other error has to end a probe as well, as the circuit would stay half-open forever.
+            self.circuit_breaker.record_failure()
+            self.desired_update_interval = timedelta(seconds=self.circuit_breaker.retry_in)
+            raise
+
+        self.circuit_breaker.record_success()
+        if data is self.data:
+            self.skipped_updates += 1
+        else:
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        # After a failed update, all entities have to be updated to become available again.
+        self.changed_fields = data.changed_fields(self.data if self.last_update_success else None)
+        self._adapt_update_interval(data)
+        return data
+
+    @callback
+    def async_set_updated_data(self, data: FireplusResponse) -> None:
+        """Manually update data and notify the entities depending on changed values."""
+        self.changed_fields = data.changed_fields(self.data if self.last_update_success else None)
+        self._adapt_update_interval(data)
+        if data is not self.data:
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        super().async_set_updated_data(data)
+
+    async def async_restore(self) -> bool:
+        """Restore the most recent snapshot from the store and return whether it was successful."""
+        stored = await self._store.async_load()
+        if stored is None:
+            return False
+
+        try:
+            data = self.config_entry.runtime_data.client.restore(
+                stored["panel"].encode(STORAGE_ENCODING),
+                stored["configuration"].encode(STORAGE_ENCODING),
+            )
+        except (KeyError, UnicodeEncodeError, FireplusApiClientError) as exception:
+            LOGGER.debug("Unable to restore the stored snapshot: %s", exception)
+            return False
+
+        self.async_set_updated_data(data)
+        return True
+
+    @callback
+    def _data_to_store(self) -> dict[str, str]:
+        """Return the raw responses of the most recent snapshot."""
+        responses = self.config_entry.runtime_data.client.responses
+        if responses is None:
+            return {}
+        panel_response, configuration_response = responses
+        return {
+            "panel": panel_response.decode(STORAGE_ENCODING),
+            "configuration": configuration_response.decode(STORAGE_ENCODING),
+        }
+
+    def _adapt_update_interval(self, data: FireplusResponse) -> None:
+        """Choose the interval of the next update based on the current state of fire+."""
+        now = time.monotonic()
+        temperature_rate = (
+            abs(data.temperature - self.data.temperature) / (now - self._last_data_at)
+            if self.data is not None and now > self._last_data_at
+            else 0.0
+        )
+        self._last_data_at = now
+
+        if (
+            data.operation_status == FireplusOperationStatus.HEATING
+            or data.door_open
+            or now < self._fast_polling_until
+            or temperature_rate >= FAST_POLLING_TEMPERATURE_RATE
+        ):
+            self.desired_update_interval = self._fast_update_interval
+        elif data.operation_status == FireplusOperationStatus.STANDBY and not self.changed_fields:
+            self.desired_update_interval = self._slow_update_interval
+        else:
+            self.desired_update_interval = self._regular_update_interval
+
+    async def async_update_settings(self, **settings: Any) -> None:
+        """Update settings of Drooff fire+ and wait until they have been written."""
+        # Settings changed within a short time, e.g. while dragging a slider, are merged and
+        # written at once. The most recent value of every setting wins.
+        self._pending_settings.update(settings)
+
+        if self._settings_write is None:
+            self._settings_write = self.config_entry.async_create_background_task(
+                self.hass, self._async_write_settings(), name=f"{DOMAIN}_write_settings"
+            )
+
+        await asyncio.shield(self._settings_write)
+
+    async def _async_write_settings(self) -> None:
+        """Write the pending settings after collecting further changes."""
+        await asyncio.sleep(SETTINGS_WRITE_DELAY)
+
+        settings = self._pending_settings
+        self._pending_settings = {}
+        self._settings_write = None
+
+        await self.config_entry.runtime_data.client.async_update_settings(**settings)
+        self._fast_polling_until = time.monotonic() + FAST_POLLING_AFTER_WRITE
+        await self._async_confirm_settings(settings)
+
+    async def _async_confirm_settings(self, settings: dict[str, Any]) -> None:
+        """Poll fire+ with increasing intervals until it reports the written settings."""
+        started = time.monotonic()
+        deadline = started + SETTINGS_CONFIRMATION_TIMEOUT
+        interval = SETTINGS_CONFIRMATION_INITIAL_INTERVAL
+
+        while True:
+            await asyncio.sleep(interval)
 
-        while retries < max_retries:
             try:
-                return await self.config_entry.runtime_data.client.async_get_data()
+                data = await self.config_entry.runtime_data.client.async_get_data(FireplusRequestPriority.CONFIRMATION)
             except FireplusApiClientError as exception:
-                retries += 1
-                if retries < max_retries:
-                    await asyncio.sleep(1)
-                else:
-                    raise UpdateFailed(exception) from exception
+                LOGGER.debug("Unable to confirm settings: %s", exception)
+                await self.async_request_refresh()
+                return
+
+            if all(getattr(data, name) == value for name, value in settings.items()):
+                self.last_confirmation_latency = time.monotonic() - started
+                break
+
+            if time.monotonic() + interval > deadline:
+                LOGGER.debug("fire+ did not confirm settings %s in time", settings)
+                break
+
+            interval = min(interval * 2, SETTINGS_CONFIRMATION_MAX_INTERVAL)
 
-        raise UpdateFailed(UPDATE_FAILED_MSG)
+        self.async_set_updated_data(data)
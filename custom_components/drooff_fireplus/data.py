@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
-    from .api import FireplusApiClient
+    from .api import FireplusApiClient, FireplusConnectionStats
     from .coordinator import FireplusDataUpdateCoordinator
 
 
@@ -21,5 +21,6 @@ class FireplusData:
     """Data for the Fireplus integration."""
 
     client: FireplusApiClient
+    connection_stats: FireplusConnectionStats
     coordinator: FireplusDataUpdateCoordinator
     integration: Integration
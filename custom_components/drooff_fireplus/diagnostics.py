@@ -0,0 +1,40 @@
+"""Diagnostics support for drooff_fireplus."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import FireplusConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: FireplusConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+
+    return {
+        "firmware_version": str(coordinator.data.version) if coordinator.data else None,
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.desired_update_interval.total_seconds(),
+            "skipped_updates": coordinator.skipped_updates,
+            "last_confirmation_latency": coordinator.last_confirmation_latency,
+        },
+        "requests": {
+            "deduplicated": entry.runtime_data.client.deduplicated_requests,
+        },
+        "connections": {
+            "created": entry.runtime_data.connection_stats.created,
+            "reused": entry.runtime_data.connection_stats.reused,
+        },
+        "circuit_breaker": {
+            "state": coordinator.circuit_breaker.state.name,
+            "failures": coordinator.circuit_breaker.failures,
+            "retry_in": coordinator.circuit_breaker.retry_in,
+        },
+    }
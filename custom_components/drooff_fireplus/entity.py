@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, ClassVar
+
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import async_get_current_platform
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .const import DOMAIN
 from .coordinator import FireplusDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .api import FireplusResponse
+    from .data import FireplusConfigEntry
+
 
 class FireplusEntity(CoordinatorEntity[FireplusDataUpdateCoordinator]):
     """FireplusEntity class."""
 
+    # Names of the values of `FireplusResponse` the state of the entity depends on. The entity is
+    # only created if the firmware of fire+ provides the first one.
+    _fireplus_fields: ClassVar[tuple[str, ...]] = ()
+
     def __init__(self, coordinator: FireplusDataUpdateCoordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
@@ -23,3 +40,59 @@ class FireplusEntity(CoordinatorEntity[FireplusDataUpdateCoordinator]):
             },
             configuration_url=f"http://{coordinator.host}",
         )
+
+    @classmethod
+    def is_supported(cls, data: FireplusResponse) -> bool:
+        """Return true if the firmware of fire+ provides the values of the entity."""
+        return cls._fireplus_fields[0] in data.capabilities
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if a value the entity depends on has changed."""
+        if self.coordinator.changed_fields.isdisjoint(self._fireplus_fields):
+            return
+        super()._handle_coordinator_update()
+
+
+@callback
+def async_add_supported_entities(
+    hass: HomeAssistant,
+    entry: FireplusConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    entity_classes: tuple[type[FireplusEntity], ...],
+) -> None:
+    """Add the entities supported by the firmware of fire+ and follow changes of its capabilities."""
+    coordinator = entry.runtime_data.coordinator
+    entity_registry = er.async_get(hass)
+    platform_domain = async_get_current_platform().domain
+    added: set[type[FireplusEntity]] = set()
+    capabilities: frozenset[str] | None = None
+
+    @callback
+    def async_update_entities() -> None:
+        nonlocal capabilities
+        if coordinator.data is None or coordinator.data.capabilities == capabilities:
+            return
+        capabilities = coordinator.data.capabilities
+
+        new_entities = []
+        for entity_class in entity_classes:
+            entity = entity_class(coordinator)
+            if entity_class.is_supported(coordinator.data):
+                if entity_class not in added:
+                    added.add(entity_class)
+                    new_entities.append(entity)
+                continue
+
+            # Entities that are no longer supported, e.g. after a firmware update, are removed from
+            # the registry, which also removes them from Home Assistant.
+            added.discard(entity_class)
+            entity_id = entity_registry.async_get_entity_id(platform_domain, DOMAIN, entity.unique_id)
+            if entity_id is not None:
+                entity_registry.async_remove(entity_id)
+
+        if new_entities:
+            async_add_entities(new_entities)
+
+    async_update_entities()
+    entry.async_on_unload(coordinator.async_add_listener(async_update_entities))
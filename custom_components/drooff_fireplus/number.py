@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING
 
 from homeassistant.components.number import (
@@ -12,7 +11,7 @@ from homeassistant.components.number import (
 )
 from homeassistant.const import PERCENTAGE, EntityCategory
 
-from .entity import FireplusEntity
+from .entity import FireplusEntity, async_add_supported_entities
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -23,23 +22,28 @@ if TYPE_CHECKING:
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: FireplusConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the number platform."""
-    async_add_entities(
-        [
-            FireplusBurnRate(entry.runtime_data.coordinator),
-            FireplusBrightness(entry.runtime_data.coordinator),
-            FireplusVolume(entry.runtime_data.coordinator),
-        ]
+    async_add_supported_entities(
+        hass,
+        entry,
+        async_add_entities,
+        (
+            FireplusBurnRate,
+            FireplusBrightness,
+            FireplusVolume,
+        ),
     )
 
 
 class FireplusBrightness(FireplusEntity, NumberEntity):
     """Drooff fire+ LED brightness."""
 
+    _fireplus_fields = ("brightness",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -66,15 +70,14 @@ class FireplusBrightness(FireplusEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.coordinator.config_entry.runtime_data.client.async_update_settings(brightness=int(value))
-        # Give fire+ time to update value
-        await asyncio.sleep(1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings(brightness=int(value))
 
 
 class FireplusVolume(FireplusEntity, NumberEntity):
     """Drooff fire+ volume."""
 
+    _fireplus_fields = ("volume",)
+
     LOW_VOLUME = 30
     MEDIUM_VOLUME = 70
 
@@ -100,10 +103,7 @@ class FireplusVolume(FireplusEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.coordinator.config_entry.runtime_data.client.async_update_settings(volume=int(value))
-        # Give fire+ time to update value
-        await asyncio.sleep(1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings(volume=int(value))
 
     @property
     def icon(self) -> str:
@@ -118,20 +118,12 @@ class FireplusVolume(FireplusEntity, NumberEntity):
             return "mdi:volume-medium"
         return "mdi:volume-high"
 
-    @property
-    def available(self) -> bool | None:
-        """Return the availability of the sensor."""
-        return self.coordinator.data.volume is not None
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added."""
-        return self.available
-
 
 class FireplusBurnRate(FireplusEntity, NumberEntity):
     """Drooff fire+ burn rate."""
 
+    _fireplus_fields = ("burn_rate", "version")
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -158,11 +150,8 @@ class FireplusBurnRate(FireplusEntity, NumberEntity):
     @property
     def native_max_value(self) -> float | None:
         """Return the maximal native value of the entity."""
-        return 7.0 if self.coordinator.data.version == 1 else 6.0
+        return float(self.coordinator.data.max_burn_rate)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.coordinator.config_entry.runtime_data.client.async_update_settings(burn_rate=int(value))
-        # Give fire+ time to update value
-        await asyncio.sleep(1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings(burn_rate=int(value))
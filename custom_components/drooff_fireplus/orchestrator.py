@@ -0,0 +1,170 @@
+"""Orchestrator scheduling the updates of all Drooff fire+."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+from yarl import URL
+
+from .api import FireplusConnectionStats, create_session
+from .const import DOMAIN, ORCHESTRATOR_MAX_CONCURRENT_UPDATES
+from .resolver import FireplusResolver
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import aiohttp
+    from homeassistant.core import Event, HomeAssistant
+
+    from .coordinator import FireplusDataUpdateCoordinator
+
+DATA_ORCHESTRATOR: HassKey[FireplusOrchestrator] = HassKey(DOMAIN)
+
+
+class FireplusOrchestrator:
+    """
+    Orchestrator that owns the scheduling of the updates of all config entries.
+
+    The updates are spread evenly across the polling interval instead of happening at the same
+    time, e.g. after Home Assistant has been started. The number of concurrent updates is limited
+    and all config entries share a single connection pool, which is closed together with the
+    orchestrator once the last config entry has been unloaded.
+    """
+
+    session: aiohttp.ClientSession
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the orchestrator."""
+        self._hass = hass
+        self._connection_stats: dict[str, FireplusConnectionStats] = {}
+        self._resolver = FireplusResolver()
+        self.session = create_session(self._resolver, stats=self._connection_stats)
+        self._remove_close_listener: Callable[[], None] | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_on_close
+        )
+        self._semaphore = asyncio.Semaphore(ORCHESTRATOR_MAX_CONCURRENT_UPDATES)
+        self._coordinators: list[FireplusDataUpdateCoordinator] = []
+        self._phases: dict[FireplusDataUpdateCoordinator, float] = {}
+        self._timers: dict[FireplusDataUpdateCoordinator, asyncio.TimerHandle] = {}
+        self._refreshing: set[FireplusDataUpdateCoordinator] = set()
+
+    @callback
+    def async_register(self, coordinator: FireplusDataUpdateCoordinator) -> Callable[[], None]:
+        """Schedule the updates of the given coordinator and return a callback to stop them."""
+        self._coordinators.append(coordinator)
+        self._assign_phases()
+        remove_listener = coordinator.async_add_listener(lambda: self._on_coordinator_update(coordinator))
+        self.async_reschedule(coordinator)
+
+        @callback
+        def unregister() -> None:
+            remove_listener()
+            self._cancel_timer(coordinator)
+            self._coordinators.remove(coordinator)
+            self._phases.pop(coordinator, None)
+            self._assign_phases()
+
+            if not self._coordinators:
+                # A config entry set up later creates a new orchestrator.
+                if self._hass.data.get(DATA_ORCHESTRATOR) is self:
+                    del self._hass.data[DATA_ORCHESTRATOR]
+                self._hass.async_create_background_task(self.async_close(), name=f"{DOMAIN}_close")
+
+        return unregister
+
+    def get_connection_stats(self, host: str) -> FireplusConnectionStats:
+        """Return the number of connections that have been created or reused for the given host."""
+        return self._connection_stats.setdefault(URL(f"http://{host}").raw_authority, FireplusConnectionStats())
+
+    @callback
+    def async_reschedule(self, coordinator: FireplusDataUpdateCoordinator) -> None:
+        """Schedule the next update of the given coordinator based on its current polling interval."""
+        self._cancel_timer(coordinator)
+
+        if coordinator.config_entry.pref_disable_polling or self._hass.is_stopping:
+            return
+
+        self._timers[coordinator] = self._hass.loop.call_at(
+            self._next_update_at(coordinator), self._start_refresh, coordinator
+        )
+
+    async def async_close(self) -> None:
+        """Stop all updates and close the shared session and its resolver."""
+        if self._remove_close_listener is not None:
+            self._remove_close_listener()
+            self._remove_close_listener = None
+        for coordinator in list(self._timers):
+            self._cancel_timer(coordinator)
+        await self.session.close()
+        await self._resolver.close()
+
+    async def _async_on_close(self, _: Event) -> None:
+        # The listener has already been removed by firing the event.
+        self._remove_close_listener = None
+        await self.async_close()
+
+    def _assign_phases(self) -> None:
+        """Spread the updates of all coordinators evenly across their polling interval."""
+        for index, coordinator in enumerate(self._coordinators):
+            self._phases[coordinator] = index / len(self._coordinators)
+
+    def _next_update_at(self, coordinator: FireplusDataUpdateCoordinator) -> float:
+        """
+        Return the point in time of the next update of the coordinator.
+
+        Regular updates happen at the first point in time of the phase of the coordinator after at
+        least half an interval. Retries after failures happen once the backoff period has passed.
+        """
+        interval = coordinator.desired_update_interval.total_seconds()
+        if interval <= 0:
+            return self._hass.loop.time()
+        if coordinator.circuit_breaker.failures:
+            # Rounding to the phase would move retries before the end of the backoff period. While a
+            # probe is still in progress, there is no backoff left and the desired interval is used.
+            return self._hass.loop.time() + (coordinator.circuit_breaker.retry_in or interval)
+        phase = self._phases.get(coordinator, 0.0)
+        periods = math.ceil((self._hass.loop.time() + interval / 2) / interval - phase)
+        return (periods + phase) * interval
+
+    def _cancel_timer(self, coordinator: FireplusDataUpdateCoordinator) -> None:
+        timer = self._timers.pop(coordinator, None)
+        if timer is not None:
+            timer.cancel()
+
+    @callback
+    def _start_refresh(self, coordinator: FireplusDataUpdateCoordinator) -> None:
+        self._timers.pop(coordinator, None)
+        coordinator.config_entry.async_create_background_task(
+            self._hass, self._async_refresh(coordinator), name=f"{DOMAIN}_refresh"
+        )
+
+    async def _async_refresh(self, coordinator: FireplusDataUpdateCoordinator) -> None:
+        """Update the given coordinator, limiting the number of concurrent updates."""
+        self._refreshing.add(coordinator)
+        try:
+            async with self._semaphore:
+                await coordinator.async_refresh()
+        finally:
+            self._refreshing.discard(coordinator)
+
+        if coordinator in self._coordinators:
+            self.async_reschedule(coordinator)
+
+    @callback
+    def _on_coordinator_update(self, coordinator: FireplusDataUpdateCoordinator) -> None:
+        """Reschedule if the coordinator has been updated outside of the schedule, e.g. after a write."""
+        if coordinator not in self._refreshing:
+            self.async_reschedule(coordinator)
+
+
+@callback
+def async_get_orchestrator(hass: HomeAssistant) -> FireplusOrchestrator:
+    """Return the orchestrator of all Drooff fire+, which is created on first use."""
+    if DATA_ORCHESTRATOR not in hass.data:
+        hass.data[DATA_ORCHESTRATOR] = FireplusOrchestrator(hass)
+    return hass.data[DATA_ORCHESTRATOR]
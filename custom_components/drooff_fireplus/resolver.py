@@ -0,0 +1,120 @@
+"""Resolver for the address of Drooff fire+."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import socket
+import time
+from typing import TYPE_CHECKING
+
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import ThreadedResolver
+
+from .const import LOGGER, RESOLVER_CACHE_TTL, RESOLVER_RACE_TIMEOUT
+
+if TYPE_CHECKING:
+    from aiohttp.abc import ResolveResult
+
+
+class FireplusResolver(AbstractResolver):
+    """
+    Resolver that caches the address of fire+ and prefers the address family that connects first.
+
+    Once resolved, an address is served from the cache. After the TTL has expired, the cached
+    address is still returned while it is refreshed in the background, and it is kept if the
+    refresh fails. Only the very first lookup of a host waits for the name resolution.
+    """
+
+    def __init__(self, resolver: AbstractResolver | None = None, ttl: float = RESOLVER_CACHE_TTL) -> None:
+        """Initialize the resolver."""
+        # The threaded resolver uses the name resolution of the system, which resolves bare host
+        # names like `fire` the same way as any other application on the network.
+        self._resolver = resolver or ThreadedResolver()
+        self._ttl = ttl
+        self._cache: dict[tuple[str, int], tuple[list[ResolveResult], float]] = {}
+        self._preferred_families: dict[str, socket.AddressFamily] = {}
+        self._refreshes: dict[tuple[str, int], asyncio.Task] = {}
+
+    async def resolve(
+        self,
+        host: str,
+        port: int = 0,
+        family: socket.AddressFamily = socket.AF_UNSPEC,
+    ) -> list[ResolveResult]:
+        """Return the addresses of the given host with the preferred address family first."""
+        key = (host, port)
+        cached = self._cache.get(key)
+
+        if cached is None:
+            return await self._async_refresh(host, port, family)
+
+        addresses, expires_at = cached
+        if time.monotonic() >= expires_at and key not in self._refreshes:
+            self._refreshes[key] = asyncio.create_task(self._async_refresh(host, port, family))
+            self._refreshes[key].add_done_callback(lambda _: self._refreshes.pop(key, None))
+
+        return addresses
+
+    async def close(self) -> None:
+        """Cancel pending refreshes and release the underlying resolver."""
+        for refresh in self._refreshes.values():
+            refresh.cancel()
+        self._refreshes.clear()
+        await self._resolver.close()
+
+    async def _async_refresh(
+        self,
+        host: str,
+        port: int,
+        family: socket.AddressFamily,
+    ) -> list[ResolveResult]:
+        """Resolve the given host and update the cache."""
+        key = (host, port)
+
+        try:
+            addresses = await self._resolver.resolve(host, port, family)
+        except OSError as exception:
+            if key not in self._cache:
+                raise
+            LOGGER.debug("Unable to resolve %s, keeping the cached address: %s", host, exception)
+            self._cache[key] = (self._cache[key][0], time.monotonic() + self._ttl)
+            return self._cache[key][0]
+
+        if host not in self._preferred_families:
+            preferred_family = await self._async_race(addresses)
+            if preferred_family is not None:
+                LOGGER.debug("Preferring %s for %s", preferred_family.name, host)
+                self._preferred_families[host] = preferred_family
+
+        preferred_family = self._preferred_families.get(host)
+        addresses.sort(key=lambda address: address["family"] != preferred_family)
+        self._cache[key] = (addresses, time.monotonic() + self._ttl)
+        return addresses
+
+    async def _async_race(self, addresses: list[ResolveResult]) -> socket.AddressFamily | None:
+        """Connect to the first address of every family and return the family that connects first."""
+        candidates: dict[socket.AddressFamily, ResolveResult] = {}
+        for address in addresses:
+            candidates.setdefault(address["family"], address)
+
+        if len(candidates) < 2:  # noqa: PLR2004
+            return None
+
+        async def connect(address: ResolveResult) -> socket.AddressFamily:
+            _, writer = await asyncio.open_connection(address["host"], address["port"])
+            writer.close()
+            return address["family"]
+
+        connections = [asyncio.create_task(connect(address)) for address in candidates.values()]
+        try:
+            for connection in asyncio.as_completed(connections, timeout=RESOLVER_RACE_TIMEOUT):
+                with contextlib.suppress(OSError):
+                    return await connection
+        except TimeoutError:
+            pass
+        finally:
+            for connection in connections:
+                connection.cancel()
+
+        return None
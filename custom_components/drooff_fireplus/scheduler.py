@@ -0,0 +1,111 @@
+"""Scheduler for the requests to Drooff fire+."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+import weakref
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from .const import SCHEDULER_BURST, SCHEDULER_RATE
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class FireplusRequestPriority(IntEnum):
+    """Priority of a request to fire+, where lower values are sent first."""
+
+    WRITE = 0
+    CONFIRMATION = 1
+    POLL = 2
+    DIAGNOSTIC = 3
+
+
+class FireplusRequestScheduler:
+    """
+    Scheduler that sends the requests to a single fire+ one after the other.
+
+    Waiting requests are sent in order of their priority, so writes are never stuck behind
+    queued polls. A token bucket limits the rate of requests to what the embedded web server of
+    fire+ handles.
+    """
+
+    def __init__(self, rate: float = SCHEDULER_RATE, burst: int = SCHEDULER_BURST) -> None:
+        """Initialize the scheduler."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._waiters: list[tuple[FireplusRequestPriority, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._busy = False
+        self._timer: asyncio.TimerHandle | None = None
+
+    @asynccontextmanager
+    async def slot(self, priority: FireplusRequestPriority) -> AsyncIterator[None]:
+        """Wait until a request with the given priority may be sent to fire+."""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # If the slot has already been granted, it has to be passed on to the next request.
+            if future.done() and not future.cancelled():
+                self._release()
+            else:
+                future.cancel()
+            raise
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        self._busy = False
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant the slot to the waiting request with the highest priority if a token is available."""
+        if self._busy or self._timer is not None:
+            return
+
+        # Requests that have been cancelled while waiting are skipped.
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        if not self._waiters:
+            return
+
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._refilled_at) * self._rate, self._burst)
+        self._refilled_at = now
+
+        if self._tokens < 1:
+            self._timer = asyncio.get_running_loop().call_later((1 - self._tokens) / self._rate, self._on_timer)
+            return
+
+        self._tokens -= 1
+        self._busy = True
+        heapq.heappop(self._waiters)[2].set_result(None)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+
+_schedulers: weakref.WeakValueDictionary[str, FireplusRequestScheduler] = weakref.WeakValueDictionary()
+
+
+def get_scheduler(host: str) -> FireplusRequestScheduler:
+    """Return the scheduler shared by all clients of the given host."""
+    scheduler = _schedulers.get(host)
+    if scheduler is None:
+        scheduler = _schedulers[host] = FireplusRequestScheduler()
+    return scheduler
@@ -21,7 +21,7 @@ from homeassistant.const import (
 
 from .api import FireplusOperationStatus
 from .const import ETHERNET_LINK
-from .entity import FireplusEntity
+from .entity import FireplusEntity, async_add_supported_entities
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -32,30 +32,35 @@ if TYPE_CHECKING:
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: FireplusConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    async_add_entities(
-        [
-            FireplusTemperatureSensor(entry.runtime_data.coordinator),
-            FireplusChimneyDraughtSensor(entry.runtime_data.coordinator),
-            FireplusAirSliderPositionSensor(entry.runtime_data.coordinator),
-            FireplusOperationStatusSensor(entry.runtime_data.coordinator),
-            FireplusOperatingTimeSensor(entry.runtime_data.coordinator),
-            FireplusHeatingProgressSensor(entry.runtime_data.coordinator),
-            FireplusErrorMessageSensor(entry.runtime_data.coordinator),
-            FireplusTargetTemperatureSensor(entry.runtime_data.coordinator),
-            FireplusWeightSensor(entry.runtime_data.coordinator),
-            FireplusWifiSignalStrengthSensor(entry.runtime_data.coordinator),
-        ]
+    async_add_supported_entities(
+        hass,
+        entry,
+        async_add_entities,
+        (
+            FireplusTemperatureSensor,
+            FireplusChimneyDraughtSensor,
+            FireplusAirSliderPositionSensor,
+            FireplusOperationStatusSensor,
+            FireplusOperatingTimeSensor,
+            FireplusHeatingProgressSensor,
+            FireplusErrorMessageSensor,
+            FireplusTargetTemperatureSensor,
+            FireplusWeightSensor,
+            FireplusWifiSignalStrengthSensor,
+        ),
     )
 
 
 class FireplusTemperatureSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ combustion chamber temperature sensor."""
 
+    _fireplus_fields = ("temperature", "max_temperature")
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -84,6 +89,8 @@ class FireplusTemperatureSensor(FireplusEntity, SensorEntity):
 class FireplusChimneyDraughtSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ chimney draught sensor."""
 
+    _fireplus_fields = ("chimney_draught", "chimney_draught_available")
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -112,6 +119,8 @@ class FireplusChimneyDraughtSensor(FireplusEntity, SensorEntity):
 class FireplusAirSliderPositionSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ air slider position sensor."""
 
+    _fireplus_fields = ("air_slider",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -134,6 +143,8 @@ class FireplusAirSliderPositionSensor(FireplusEntity, SensorEntity):
 class FireplusOperationStatusSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ operation status sensor."""
 
+    _fireplus_fields = ("operation_status",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -165,6 +176,8 @@ class FireplusOperationStatusSensor(FireplusEntity, SensorEntity):
 class FireplusOperatingTimeSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ operating time sensor."""
 
+    _fireplus_fields = ("operating_time",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -188,20 +201,12 @@ class FireplusOperatingTimeSensor(FireplusEntity, SensorEntity):
         """Return the native value of the sensor."""
         return self.coordinator.data.operating_time
 
-    @property
-    def available(self) -> bool | None:
-        """Return the availability of the sensor."""
-        return self.coordinator.data.operating_time is not None
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added."""
-        return self.available
-
 
 class FireplusHeatingProgressSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ heating progress sensor."""
 
+    _fireplus_fields = ("heating_progress", "operation_status")
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -229,6 +234,8 @@ class FireplusHeatingProgressSensor(FireplusEntity, SensorEntity):
 class FireplusErrorMessageSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ error message sensor."""
 
+    _fireplus_fields = ("error", "error_code")
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -261,6 +268,8 @@ class FireplusErrorMessageSensor(FireplusEntity, SensorEntity):
 class FireplusTargetTemperatureSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ target chamber temperature."""
 
+    _fireplus_fields = ("target_temperature",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -280,20 +289,12 @@ class FireplusTargetTemperatureSensor(FireplusEntity, SensorEntity):
         """Return the native value of the sensor."""
         return self.coordinator.data.target_temperature
 
-    @property
-    def available(self) -> bool | None:
-        """Return the availability of the sensor."""
-        return self.coordinator.data.target_temperature is not None
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added."""
-        return self.available
-
 
 class FireplusWeightSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ weight sensor."""
 
+    _fireplus_fields = ("weight",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -327,6 +328,8 @@ class FireplusWeightSensor(FireplusEntity, SensorEntity):
 class FireplusWifiSignalStrengthSensor(FireplusEntity, SensorEntity):
     """Drooff fire+ wifi signal strength sensor."""
 
+    _fireplus_fields = ("wifi_signal_strength",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
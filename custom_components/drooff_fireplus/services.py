@@ -0,0 +1,72 @@
+"""Services of drooff_fireplus."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall
+
+    from .data import FireplusConfigEntry
+
+SERVICE_APPLY_SETTINGS = "apply_settings"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+SETTINGS = ("burn_rate", "brightness", "volume", "ember_burndown", "led")
+
+APPLY_SETTINGS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+            vol.Optional("burn_rate"): vol.All(vol.Coerce(int), vol.Range(min=1, max=7)),
+            vol.Optional("brightness"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional("volume"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional("ember_burndown"): cv.boolean,
+            vol.Optional("led"): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(*SETTINGS),
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the Drooff fire+ integration."""
+
+    async def async_apply_settings(call: ServiceCall) -> None:
+        """Apply several settings to fire+ with a single update."""
+        entry: FireplusConfigEntry | None = hass.config_entries.async_get_entry(call.data[ATTR_CONFIG_ENTRY_ID])
+        if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_loaded",
+            )
+
+        settings = {setting: call.data[setting] for setting in SETTINGS if setting in call.data}
+
+        # Settings the firmware does not support would be left out of the update without notice.
+        data = entry.runtime_data.coordinator.data
+        unsupported = [setting for setting in settings if setting not in data.capabilities]
+        if unsupported:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="setting_not_supported",
+                translation_placeholders={"settings": ", ".join(unsupported)},
+            )
+        if settings.get("burn_rate", 1) > data.max_burn_rate:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="burn_rate_not_supported",
+                translation_placeholders={"max_burn_rate": str(data.max_burn_rate)},
+            )
+
+        await entry.runtime_data.coordinator.async_update_settings(**settings)
+
+    hass.services.async_register(DOMAIN, SERVICE_APPLY_SETTINGS, async_apply_settings, schema=APPLY_SETTINGS_SCHEMA)
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 
-from .entity import FireplusEntity
+from .entity import FireplusEntity, async_add_supported_entities
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -18,22 +17,27 @@ if TYPE_CHECKING:
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: FireplusConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the switch platform."""
-    async_add_entities(
-        [
-            FireplusEmberBurndownSwitch(entry.runtime_data.coordinator),
-            FireplusLedSwitch(entry.runtime_data.coordinator),
-        ]
+    async_add_supported_entities(
+        hass,
+        entry,
+        async_add_entities,
+        (
+            FireplusEmberBurndownSwitch,
+            FireplusLedSwitch,
+        ),
     )
 
 
 class FireplusEmberBurndownSwitch(FireplusEntity, SwitchEntity):
     """Switch to toggle between ember preservation and ember burndown."""
 
+    _fireplus_fields = ("ember_burndown",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -57,22 +61,18 @@ class FireplusEmberBurndownSwitch(FireplusEntity, SwitchEntity):
 
     async def async_turn_on(self, **_: Any) -> None:
         """Activate ember burndown."""
-        await self.coordinator.config_entry.runtime_data.client.async_update_settings(ember_burndown=True)
-        # Give fire+ time to update value
-        await asyncio.sleep(1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings(ember_burndown=True)
 
     async def async_turn_off(self, **_: Any) -> None:
         """Activate ember preservation."""
-        await self.coordinator.config_entry.runtime_data.client.async_update_settings(ember_burndown=False)
-        # Give fire+ time to update value
-        await asyncio.sleep(1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings(ember_burndown=False)
 
 
 class FireplusLedSwitch(FireplusEntity, SwitchEntity):
     """Switch to toggle LED."""
 
+    _fireplus_fields = ("led",)
+
     def __init__(
         self,
         coordinator: FireplusDataUpdateCoordinator,
@@ -94,24 +94,8 @@ class FireplusLedSwitch(FireplusEntity, SwitchEntity):
 
     async def async_turn_on(self, **_: Any) -> None:
         """Activate led."""
-        await self.coordinator.config_entry.runtime_data.client.async_update_settings(led=True)
-        # Give fire+ time to update value
-        await asyncio.sleep(1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings(led=True)
 
     async def async_turn_off(self, **_: Any) -> None:
         """Deactivate led."""
-        await self.coordinator.config_entry.runtime_data.client.async_update_settings(led=False)
-        # Give fire+ time to update value
-        await asyncio.sleep(1)
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def available(self) -> bool | None:
-        """Return the availability of the switch."""
-        return self.coordinator.data.led is not None
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added."""
-        return self.available
+        await self.coordinator.async_update_settings(led=False)
@@ -0,0 +1,94 @@
+"""Recorder of the raw responses of Drooff fire+."""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import TYPE_CHECKING
+
+from .const import RESPONSE_ENCODING, TRACE_BACKUP_COUNT, TRACE_MAX_BYTES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+
+class FireplusTraceRecorder:
+    """
+    Recorder that streams the raw responses of fire+ to a rotating JSONL file.
+
+    Every line holds the time of a response, the path of the request and the response itself,
+    so a trace can be replayed offline. Records are encoded and written in a separate thread,
+    so recording does not block the event loop.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = TRACE_MAX_BYTES,
+        backup_count: int = TRACE_BACKUP_COUNT,
+    ) -> None:
+        """Initialize the recorder, which does not record before it has been started."""
+        self.path = path
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._handler = _TraceQueueHandler(self._queue)
+        self._listener: QueueListener | None = None
+
+    def start(self) -> None:
+        """Open the trace file and start writing records. This method does blocking I/O."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            self.path, maxBytes=self._max_bytes, backupCount=self._backup_count, encoding="utf-8"
+        )
+        file_handler.setFormatter(_TraceFormatter())
+        self._listener = QueueListener(self._queue, file_handler)
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Write all pending records and close the trace file. This method does blocking I/O."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
+
+    def record(self, path: str, response: bytes) -> None:
+        """Record a response to a request of the given path."""
+        record = logging.LogRecord(__name__, logging.INFO, "", 0, (time.time(), path, response), None, None)
+        self._handler.handle(record)
+
+
+def read_trace(paths: Iterable[Path]) -> list[tuple[float, str, bytes]]:
+    """Return the time, path and response of the records of the given trace files in order of time."""
+    records = []
+    for path in paths:
+        with path.open(encoding="utf-8") as file:
+            for line in file:
+                record = json.loads(line)
+                records.append(
+                    (record["time"], record["path"], record["response"].encode(RESPONSE_ENCODING, "surrogateescape"))
+                )
+    # Rotated files hold older records, so the records are sorted regardless of the order of the files.
+    records.sort(key=lambda record: record[0])
+    return records
+
+
+class _TraceQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The record is encoded by the file handler in the thread of the listener.
+        return record
+
+
+class _TraceFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp, path, response = record.msg
+        # Bytes that are not valid in the encoding of fire+ are preserved as surrogates.
+        return json.dumps(
+            {"time": timestamp, "path": path, "response": response.decode(RESPONSE_ENCODING, "surrogateescape")}
+        )
@@ -0,0 +1 @@
+"""Simulator of Drooff fire+ for testing the integration without a fireplace."""
@@ -0,0 +1,47 @@
+"""
+Run a simulated Drooff fire+.
+
+Run from the root of the repository with `python -m simulator`, then add the integration with
+the host and port of the simulator, e.g. `127.0.0.1:8080`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from aiohttp import web
+
+from .device import FIRMWARE_VERSIONS, SimulatedFireplus
+from .server import FaultProfile, create_app
+
+
+def main() -> None:
+    """Serve a simulated fire+ with the given firmware version and fault profile."""
+    parser = argparse.ArgumentParser(prog="python -m simulator", description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument("--firmware", choices=FIRMWARE_VERSIONS, default=FIRMWARE_VERSIONS[-1])
+    parser.add_argument("--latency", type=float, default=0.0, help="mean latency of responses in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="maximum deviation from the latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="fraction of requests that are not answered")
+    parser.add_argument("--apply-delay", type=float, default=1.0, help="delay until settings are applied in seconds")
+    parser.add_argument("--speed", type=float, default=1.0, help="number of simulated seconds per second")
+    parser.add_argument("--seed", type=int, help="seed of the random number generator")
+    args = parser.parse_args()
+
+    device = SimulatedFireplus(version=args.firmware, rng=random.Random(args.seed))  # noqa: S311
+    faults = FaultProfile(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        apply_delay=args.apply_delay,
+        speed=args.speed,
+    )
+    web.run_app(create_app(device, faults), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""State model of a simulated Drooff fire+."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+FIRMWARE_VERSIONS = ("1.0.0", "2.0.0", "2.4.0")
+
+AMBIENT_TEMPERATURE = 20.0
+
+
+class LedStatus(StrEnum):
+    """LED status reported by fire+, which the integration maps to the operation status."""
+
+    STANDBY = "aus"
+    REGULAR = "Gruen"
+    HEATING = "Gruen blinkt"
+    WOOD_REQUIRED = "Gelb"
+    WOOD_URGENTLY_REQUIRED = "Gelb blinkt"
+    EMBER_PRESERVATION = "Violett dunkel"
+    EMBER_BURNDOWN = "Orange"
+
+
+@dataclass
+class SimulatedFireplus:
+    """
+    Drooff fire+ that burns through loads of wood.
+
+    A fire is lit on a cold fireplace, heats up to the target temperature and burns until the wood
+    is used up. The fireplace then asks for more wood, which is added by opening the door, or
+    cools down until it is back in standby.
+    """
+
+    version: str = "2.4.0"
+    max_temperature: int = 900
+    serial_number: str = "123456789"
+    heating_reference: int = 600
+    # Probability per simulated second that a fire is lit while in standby
+    ignition_rate: float = 0.01
+    # Probability per simulated second that wood is added while wood is required
+    refill_rate: float = 0.005
+    rng: random.Random = field(default_factory=random.Random)
+
+    # Settings that can be written
+    betrieb: int = 3
+    leistung: int = 4
+    brightness: int = 50
+    volume: int = 70
+    ember_burndown: bool = False
+    led: bool = True
+    web_controls_shown: bool = True
+    count: int = 0
+
+    # Measured values
+    temperature: float = AMBIENT_TEMPERATURE
+    target_temperature: int = 600
+    air_slider: float = 0.0
+    chimney_draught: float = 0.0
+    led_status: LedStatus = LedStatus.STANDBY
+    heating_counter: float = 0.0
+    wood: float = 0.0
+    door_open: bool = False
+    door_open_for: float = 0.0
+    operating_time: float = 0.0
+    error_code: int = 0
+    network: int = 3
+
+    def __post_init__(self) -> None:
+        """Validate the firmware version."""
+        if self.version not in FIRMWARE_VERSIONS:
+            msg = f"Unsupported firmware version {self.version}, expected one of {', '.join(FIRMWARE_VERSIONS)}"
+            raise ValueError(msg)
+
+    @property
+    def is_v2(self) -> bool:
+        """Return true if the firmware uses the layout of version 2.0.0 or later."""
+        return self.version != "1.0.0"
+
+    @property
+    def is_v2_4(self) -> bool:
+        """Return true if the firmware uses the layout of version 2.4.0 or later."""
+        return self.version == "2.4.0"
+
+    def step(self, seconds: float) -> None:
+        """Advance the simulation by the given number of seconds."""
+        burning = self.led_status not in (LedStatus.STANDBY, LedStatus.EMBER_PRESERVATION, LedStatus.EMBER_BURNDOWN)
+
+        if self.door_open:
+            self.door_open_for -= seconds
+            if self.door_open_for <= 0:
+                self.door_open = False
+        elif self.led_status == LedStatus.STANDBY and self.rng.random() < self.ignition_rate * seconds:
+            self._add_wood()
+            self.led_status = LedStatus.HEATING
+            self.heating_counter = 0.0
+        elif (
+            self.led_status
+            in (
+                LedStatus.WOOD_REQUIRED,
+                LedStatus.WOOD_URGENTLY_REQUIRED,
+            )
+            and self.rng.random() < self.refill_rate * seconds
+        ):
+            self._add_wood()
+            self.led_status = LedStatus.REGULAR
+
+        if burning:
+            self.operating_time += seconds
+            # The burn rate determines how fast the wood is used up.
+            self.wood = max(self.wood - seconds * self.leistung * self.betrieb / 20_000, 0.0)
+
+        # The temperature approaches the target temperature while wood is burning and the ambient
+        # temperature otherwise.
+        goal = self.target_temperature * min(self.wood * 2, 1.0) if burning else AMBIENT_TEMPERATURE
+        self.temperature += (goal - self.temperature) * min(seconds / 300, 1.0)
+        self.air_slider = 100.0 * min(self.wood, 1.0) if burning else 0.0
+        self.chimney_draught = max((self.temperature - AMBIENT_TEMPERATURE) / 40, 0.0)
+
+        self._update_led_status(seconds)
+
+    def _add_wood(self) -> None:
+        self.wood = 1.0
+        self.door_open = True
+        self.door_open_for = 10.0
+
+    def _update_led_status(self, seconds: float) -> None:
+        if self.led_status == LedStatus.HEATING:
+            self.heating_counter = min(self.heating_counter + seconds, self.heating_reference)
+            if self.heating_counter >= self.heating_reference:
+                self.led_status = LedStatus.REGULAR
+        elif self.led_status == LedStatus.REGULAR and self.wood < 0.2:  # noqa: PLR2004
+            self.led_status = LedStatus.WOOD_REQUIRED
+        elif self.led_status == LedStatus.WOOD_REQUIRED and self.wood < 0.1:  # noqa: PLR2004
+            self.led_status = LedStatus.WOOD_URGENTLY_REQUIRED
+        elif self.led_status == LedStatus.WOOD_URGENTLY_REQUIRED and self.wood == 0.0:
+            self.led_status = LedStatus.EMBER_BURNDOWN if self.ember_burndown else LedStatus.EMBER_PRESERVATION
+        elif self.led_status in (LedStatus.EMBER_PRESERVATION, LedStatus.EMBER_BURNDOWN) and self.temperature < 50:  # noqa: PLR2004
+            self.led_status = LedStatus.STANDBY
+
+    def apply_settings(self, settings: dict[str, str]) -> bool:
+        """Apply the settings posted to `easpanelW.php` and return whether they have been accepted."""
+        if self.is_v2:
+            # Writes are only accepted if they carry the successor of the current counter.
+            count = int(settings["CNT"])
+            if count != (self.count + 1) % 100:
+                return False
+            self.count = count
+            self.volume = int(settings["Lautstaerke"])
+        else:
+            self.led = settings["LED"] == "1"
+
+        self.betrieb = int(settings["Betrieb"])
+        self.leistung = int(settings["Leistung"])
+        self.brightness = int(settings["Helligkeit"])
+        self.web_controls_shown = settings["Bedienung"] == "1"
+        self.ember_burndown = settings["AB"] == "1"
+        return True
+
+    def panel_values(self) -> list[str]:
+        """Return the values of `easpanel.php` in the layout of the firmware version."""
+        values = [
+            "",
+            _flag(self.web_controls_shown),
+            str(self.betrieb),
+            str(self.leistung),
+            str(self.brightness),
+            str(round(self.temperature)),
+            f"{self.air_slider:.1f}",
+            f"{self.chimney_draught:.1f}",
+            str(self.led_status),
+            str(self.error_code),
+        ]
+
+        if self.is_v2:
+            values += [
+                _flag(self.ember_burndown),
+                str(int(self.heating_counter)),
+                str(self.volume),
+                "0",
+                "0",
+                "0",
+                str(self.count),
+            ]
+        else:
+            values += [
+                _flag(self.led),
+                _flag(self.ember_burndown),
+                str(int(self.heating_counter)),
+            ]
+
+        if self.is_v2_4:
+            values += [
+                str(self.target_temperature),
+                # Recommended wood load in 10 g
+                "250" if self.led_status in (LedStatus.WOOD_REQUIRED, LedStatus.WOOD_URGENTLY_REQUIRED) else "0",
+                "auf" if self.door_open else "zu",
+                str(self.network),
+            ]
+
+        return [*values, ""]
+
+    def configuration_values(self) -> list[str]:
+        """Return the values of `easkonfig.php`."""
+        return [
+            self.version,
+            str(self.max_temperature),
+            "0",
+            self.serial_number,
+            "1",
+            "0",
+            str(self.heating_reference),
+            str(int(self.operating_time)),
+            "",
+        ]
+
+
+def encode(values: list[str]) -> bytes:
+    """Encode values the way fire+ does: a JSON encoded string preceded by a byte order mark."""
+    return ('\ufeff"' + "\\n".join(values) + '"').encode()
+
+
+def _flag(value: bool) -> str:  # noqa: FBT001
+    return "1" if value else "0"
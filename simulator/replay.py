@@ -0,0 +1,285 @@
+"""
+Replay a trace of the raw responses of Drooff fire+.
+
+By default, all panel responses of the trace are parsed as fast as possible and the number of
+changes per value is printed, which reproduces parsing bugs and allows profiling, e.g. with
+`python -m cProfile -m simulator.replay`. With `--coordinator`, the client and coordinator of
+the integration poll the trace on the recorded timestamps, so requests, skipped updates, changed
+values and the adaptive polling interval can be analyzed offline. This mode requires the test
+harness of Home Assistant, see `requirements.txt`. With `--serve`, the
+responses are served at the given speed, so the integration can be pointed at the replay like
+at the simulator.
+
+Run from the root of the repository with `python -m simulator.replay TRACE [TRACE ...]`, where
+the trace files are recorded by the integration if enabled in its options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import tempfile
+import time
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import web
+from yarl import URL
+
+from custom_components.drooff_fireplus import api as api_module
+from custom_components.drooff_fireplus import scheduler as scheduler_module
+from custom_components.drooff_fireplus.api import (
+    FireplusApiClient,
+    FireplusApiClientInvalidResponseError,
+    FireplusResponse,
+)
+from custom_components.drooff_fireplus.const import (
+    DEFAULT_FAST_POLLING_INTERVAL,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SLOW_POLLING_INTERVAL,
+    DOMAIN,
+)
+from custom_components.drooff_fireplus.trace import read_trace
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+PANEL = "php/easpanel.php"
+CONFIGURATION = "php/easkonfig.php"
+
+# Host of the client feeding the trace through the coordinator
+REPLAY_HOST = "replay"
+
+type Trace = list[tuple[float, str, bytes]]
+
+RESPONSES: web.AppKey[dict[str, bytes]] = web.AppKey("responses", dict)
+
+
+def parse(trace: Trace) -> None:
+    """Parse all panel responses of the trace and print the number of changes per value."""
+    # The configuration is requested after the panel, so the first panel response is parsed with
+    # the first configuration response.
+    configuration_response = next((response for _, path, response in trace if path == CONFIGURATION), None)
+    previous = None
+    responses = 0
+    errors = 0
+    changes: Counter[str] = Counter()
+
+    started = time.perf_counter()
+    for _, path, response in trace:
+        if path == CONFIGURATION:
+            configuration_response = response
+            continue
+        if configuration_response is None:
+            continue
+
+        responses += 1
+        try:
+            data = FireplusResponse(response, configuration_response)
+        except FireplusApiClientInvalidResponseError as exception:
+            errors += 1
+            print(exception)  # noqa: T201
+            continue
+        changes.update(data.changed_fields(previous))
+        previous = data
+    duration = time.perf_counter() - started
+
+    print(f"{responses} panel responses, {errors} errors, {duration * 1000:.1f} ms")  # noqa: T201
+    for name, count in changes.most_common():
+        print(f"{name:26} {count} changes")  # noqa: T201
+
+
+class TraceSession:
+    """Session that answers the requests of `FireplusApiClient` with the most recent responses of a trace."""
+
+    def __init__(self) -> None:
+        """Initialize the session, which has not received any response yet."""
+        self.responses: dict[str, bytes] = {}
+        self.requests: Counter[str] = Counter()
+
+    async def request(self, method: str, url: str, **_: Any) -> TraceResponse:
+        """Return the most recent response to the path of the given URL."""
+        path = URL(url).path.removeprefix("/")
+        self.requests[path] += 1
+        # Settings are not changed during a replay, but a write would be acknowledged like by fire+.
+        if method == "post":
+            return TraceResponse(b"")
+        response = self.responses.get(path)
+        if response is None:
+            msg = f"No response to {path} recorded yet"
+            raise aiohttp.ClientConnectionError(msg)
+        return TraceResponse(response)
+
+
+class TraceResponse:
+    """Successful response of a `TraceSession`."""
+
+    def __init__(self, body: bytes) -> None:
+        """Initialize the response."""
+        self._body = body
+
+    def raise_for_status(self) -> None:
+        """Do nothing, as only successful responses are recorded."""
+
+    async def read(self) -> bytes:
+        """Return the raw body of the response."""
+        return self._body
+
+
+class TraceClock:
+    """Clock following the timestamps of the trace, so time-based decisions match the recording."""
+
+    def __init__(self, now: float) -> None:
+        """Initialize the clock at the given timestamp."""
+        self.now = now
+
+    def monotonic(self) -> float:
+        """Return the timestamp of the current record."""
+        return self.now
+
+
+async def replay_coordinator(trace: Trace, speed: float) -> None:
+    """Feed the trace through the client and coordinator of the integration and print their decisions."""
+    # Home Assistant and its test harness are only required by this mode.
+    from homeassistant.const import CONF_HOST  # noqa: PLC0415
+    from homeassistant.core import HomeAssistant  # noqa: PLC0415
+    from pytest_homeassistant_custom_component.common import MockConfigEntry  # noqa: PLC0415
+
+    from custom_components.drooff_fireplus import coordinator as coordinator_module  # noqa: PLC0415
+    from custom_components.drooff_fireplus.coordinator import FireplusDataUpdateCoordinator  # noqa: PLC0415
+
+    # The configuration is requested after the panel, so it belongs to the same poll. Records before
+    # the first panel response are available from the first poll on.
+    polls: list[tuple[float, dict[str, bytes]]] = [(trace[0][0], {})]
+    for timestamp, path, response in trace:
+        if path == PANEL:
+            polls.append((timestamp, {}))
+        polls[-1][1][path] = response
+
+    clock = TraceClock(trace[0][0])
+    session = TraceSession()
+    failures = 0
+    changes: Counter[str] = Counter()
+    intervals: Counter[float] = Counter()
+    started_at = time.monotonic()
+
+    # The client, its scheduler and the coordinator follow the clock of the trace, so the
+    # configuration is cached and requests are limited like while recording.
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        patch.object(api_module, "time", clock),
+        patch.object(scheduler_module, "time", clock),
+        patch.object(coordinator_module, "time", clock),
+    ):
+        hass = HomeAssistant(config_dir)
+        client = FireplusApiClient(REPLAY_HOST, session)
+        entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: REPLAY_HOST}, minor_version=3)
+        entry.runtime_data = SimpleNamespace(client=client)
+        coordinator = FireplusDataUpdateCoordinator(
+            hass,
+            entry,
+            update_interval=timedelta(seconds=DEFAULT_POLLING_INTERVAL),
+            fast_update_interval=timedelta(seconds=DEFAULT_FAST_POLLING_INTERVAL),
+            slow_update_interval=timedelta(seconds=DEFAULT_SLOW_POLLING_INTERVAL),
+        )
+
+        for timestamp, responses in polls:
+            session.responses.update(responses)
+            if PANEL not in responses:
+                continue
+
+            if speed > 0:
+                await asyncio.sleep(started_at + (timestamp - trace[0][0]) / speed - time.monotonic())
+            clock.now = timestamp
+
+            await coordinator.async_refresh()
+            if not coordinator.last_update_success:
+                failures += 1
+                continue
+            changes.update(coordinator.changed_fields)
+            intervals[coordinator.desired_update_interval.total_seconds()] += 1
+
+        await hass.async_stop(force=True)
+
+    print(f"{len(polls) - 1} polls, {coordinator.skipped_updates} skipped updates, {failures} failures")  # noqa: T201
+    for path, count in sorted(session.requests.items()):
+        print(f"{count} requests of {path}")  # noqa: T201
+    for interval, count in sorted(intervals.items()):
+        print(f"next update in {interval:g} s after {count} polls")  # noqa: T201
+    for name, count in changes.most_common():
+        print(f"{name:26} {count} changes")  # noqa: T201
+
+
+def create_app(trace: Trace, speed: float) -> web.Application:
+    """Create a web application serving the responses of the trace at the given speed."""
+    app = web.Application()
+    app[RESPONSES] = {}
+
+    async def get(request: web.Request) -> web.Response:
+        response = request.app[RESPONSES].get(request.path.removeprefix("/"))
+        if response is None:
+            raise web.HTTPServiceUnavailable
+        return web.Response(body=response, content_type="text/html")
+
+    async def write(_: web.Request) -> web.Response:
+        # Written settings are ignored, as the trace determines the responses.
+        return web.Response()
+
+    async def play(app: web.Application) -> AsyncIterator[None]:
+        async def run() -> None:
+            started_at = time.monotonic()
+            for timestamp, path, response in trace:
+                await asyncio.sleep(started_at + (timestamp - trace[0][0]) / speed - time.monotonic())
+                app[RESPONSES][path] = response
+            print("End of trace reached")  # noqa: T201
+
+        task = asyncio.create_task(run())
+        yield
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    app.router.add_get(f"/{PANEL}", get)
+    app.router.add_get(f"/{CONFIGURATION}", get)
+    app.router.add_post("/php/easpanelW.php", write)
+    app.cleanup_ctx.append(play)
+    return app
+
+
+def main() -> None:
+    """Parse or serve the given trace files."""
+    parser = argparse.ArgumentParser(prog="python -m simulator.replay", description=__doc__.splitlines()[1])
+    parser.add_argument("traces", nargs="+", type=Path, help="trace files, including rotated ones")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--coordinator", action="store_true", help="feed the responses through the coordinator")
+    mode.add_argument("--serve", action="store_true", help="serve the responses instead of parsing them")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=60.0,
+        help="number of recorded seconds per second, or 0 to feed the coordinator as fast as possible",
+    )
+    args = parser.parse_args()
+
+    trace = read_trace(args.traces)
+    if not trace:
+        parser.error("the trace files do not contain any records")
+
+    if args.serve:
+        web.run_app(create_app(trace, args.speed), host=args.host, port=args.port)
+    elif args.coordinator:
+        asyncio.run(replay_coordinator(trace, args.speed))
+    else:
+        parse(trace)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Web server of a simulated Drooff fire+."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from .device import SimulatedFireplus, encode
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+# Interval in seconds in which the state of the device is advanced
+TICK = 1.0
+
+# Duration in seconds a request hangs to simulate a timeout
+HANG_DURATION = 120.0
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """Timing and failures of the responses of the simulated fire+."""
+
+    # Mean latency and maximum deviation from it in seconds
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Fraction of requests answered with an internal server error
+    error_rate: float = 0.0
+    # Fraction of requests that are never answered
+    timeout_rate: float = 0.0
+    # Delay in seconds until posted settings are applied
+    apply_delay: float = 1.0
+    # Number of simulated seconds per real second
+    speed: float = 1.0
+
+
+DEVICE: web.AppKey[SimulatedFireplus] = web.AppKey("device", SimulatedFireplus)
+FAULTS: web.AppKey[FaultProfile] = web.AppKey("faults", FaultProfile)
+
+
+def create_app(device: SimulatedFireplus, faults: FaultProfile | None = None) -> web.Application:
+    """Create the web application of the simulated fire+."""
+    app = web.Application(middlewares=[_faults_middleware])
+    app[DEVICE] = device
+    app[FAULTS] = faults or FaultProfile()
+    app.router.add_get("/php/easpanel.php", _panel)
+    app.router.add_get("/php/easkonfig.php", _configuration)
+    app.router.add_post("/php/easpanelW.php", _write)
+    app.cleanup_ctx.append(_evolve)
+    return app
+
+
+@web.middleware
+async def _faults_middleware(
+    request: web.Request, handler: Callable[[web.Request], Awaitable[web.StreamResponse]]
+) -> web.StreamResponse:
+    """Delay the response and fail randomly according to the fault profile."""
+    faults = request.app[FAULTS]
+    rng = request.app[DEVICE].rng
+
+    delay = faults.latency + rng.uniform(-faults.jitter, faults.jitter)
+    await asyncio.sleep(max(delay, 0.0))
+
+    roll = rng.random()
+    if roll < faults.timeout_rate:
+        await asyncio.sleep(HANG_DURATION)
+    elif roll < faults.timeout_rate + faults.error_rate:
+        raise web.HTTPInternalServerError
+
+    return await handler(request)
+
+
+async def _panel(request: web.Request) -> web.Response:
+    return web.Response(body=encode(request.app[DEVICE].panel_values()), content_type="text/html")
+
+
+async def _configuration(request: web.Request) -> web.Response:
+    return web.Response(body=encode(request.app[DEVICE].configuration_values()), content_type="text/html")
+
+
+async def _write(request: web.Request) -> web.Response:
+    """Accept the settings, which fire+ applies with a delay like the real device."""
+    device = request.app[DEVICE]
+    settings = {name: str(value) for name, value in (await request.post()).items()}
+    asyncio.get_running_loop().call_later(request.app[FAULTS].apply_delay, device.apply_settings, settings)
+    return web.Response()
+
+
+async def _evolve(app: web.Application) -> AsyncIterator[None]:
+    """Advance the state of the device in the background while the server is running."""
+
+    async def run() -> None:
+        while True:
+            await asyncio.sleep(TICK)
+            app[DEVICE].step(TICK * app[FAULTS].speed)
+
+    task = asyncio.create_task(run())
+    yield
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task